@@ -13,7 +13,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from releasio.config import load_config
-from releasio.core.commits import calculate_bump, filter_skip_release_commits, parse_commits
+from releasio.core.commits import calculate_bump, parse_commits
 from releasio.core.version import BumpType, Version
 from releasio.exceptions import (
     ConfigError,
@@ -74,27 +74,26 @@ def run_check(
     # Detect first release (no existing tags)
     is_first_release = latest_tag is None
 
-    # Get commits since last tag
-    commits = repo.get_commits_since_tag(latest_tag)
+    # Get commits since last tag; git drops commits with skip release markers
+    commits = repo.get_commits_since_tag(
+        latest_tag, skip_patterns=config.commits.skip_release_patterns
+    )
 
     if not commits:
-        console.print(
-            Panel(
-                "[yellow]No commits found since last release.[/]\n\n"
-                "Make some commits and try again.",
-                title="No Changes",
-                border_style="yellow",
+        if repo.get_commits_since_tag(latest_tag):
+            console.print(
+                Panel(
+                    "[yellow]All commits have skip release markers.[/]\n\nNo release needed.",
+                    title="No Changes",
+                    border_style="yellow",
+                )
             )
-        )
-        return
-
-    # Filter out commits with skip release markers
-    commits = filter_skip_release_commits(commits, config.commits.skip_release_patterns)
+            return
 
-    if not commits:
         console.print(
             Panel(
-                "[yellow]All commits have skip release markers.[/]\n\nNo release needed.",
+                "[yellow]No commits found since last release.[/]\n\n"
+                "Make some commits and try again.",
                 title="No Changes",
                 border_style="yellow",
             )
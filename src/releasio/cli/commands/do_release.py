@@ -27,7 +27,7 @@ from typing import TYPE_CHECKING
 from rich.panel import Panel
 
 from releasio.config import load_config
-from releasio.core.commits import calculate_bump, filter_skip_release_commits, parse_commits
+from releasio.core.commits import calculate_bump, parse_commits
 from releasio.core.version import BumpType, Version
 from releasio.exceptions import (
     ConfigError,
@@ -174,18 +174,17 @@ def run_do_release(
     # Detect first release (no existing tags)
     is_first_release = latest_tag is None
 
-    # Get commits since last tag
-    commits = repo.get_commits_since_tag(latest_tag)
+    # Get commits since last tag; git drops commits with skip release markers
+    commits = repo.get_commits_since_tag(
+        latest_tag, skip_patterns=config.commits.skip_release_patterns
+    )
 
     if not commits:
-        console.print("[yellow]No commits found since last release. Nothing to do.[/]")
-        return
-
-    # Filter out commits with skip release markers
-    commits = filter_skip_release_commits(commits, config.commits.skip_release_patterns)
+        if repo.get_commits_since_tag(latest_tag):
+            console.print("[yellow]All commits have skip release markers. Nothing to do.[/]")
+            return
 
-    if not commits:
-        console.print("[yellow]All commits have skip release markers. Nothing to do.[/]")
+        console.print("[yellow]No commits found since last release. Nothing to do.[/]")
         return
 
     # Parse commits and calculate bump
@@ -543,7 +542,7 @@ def _perform_update(
 
     # Generate changelog
     try:
-        from releasio.core.changelog import generate_changelog
+        from releasio.core.changelog import generate_changelog, prepend_changelog
 
         github_repo_str: str | None = None
         try:
@@ -557,22 +556,17 @@ def _perform_update(
                 "Changelog will not include PR links.[/]"
             )
 
+        changelog_path = project_path / config.changelog.path
         changelog_content = generate_changelog(
             repo=repo,
             version=next_version,
             config=config,
             github_repo=github_repo_str,
             console=console,
+            output_path=changelog_path,
         )
-
-        changelog_path = project_path / config.changelog.path
-        if changelog_path.exists():
-            existing = changelog_path.read_text()
-            new_content = changelog_content + "\n" + existing
-        else:
-            new_content = changelog_content
-
-        changelog_path.write_text(new_content)
+        if changelog_content is not None:
+            prepend_changelog(changelog_path, changelog_content)
         console.print(f"  [green]✓[/] Updated {config.changelog.path}")
         files_modified.append(changelog_path)
     except Exception as e:
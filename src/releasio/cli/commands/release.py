@@ -586,11 +586,13 @@ def _generate_changelog_from_commits(
     by_type: dict[str, list[Any]] = {}
     breaking: list[Any] = []
 
+    # Breaking commits are listed once, in their own section, so they are
+    # kept out of the per-type buckets
     for pc in parsed_commits:
         if pc.is_breaking:
             breaking.append(pc)
-        commit_type = pc.commit_type or "other"
-        by_type.setdefault(commit_type, []).append(pc)
+        else:
+            by_type.setdefault(pc.commit_type or "other", []).append(pc)
 
     # Type labels with and without emojis
     type_labels_with_emoji = {
@@ -696,10 +698,7 @@ def _generate_changelog_from_commits(
 
     # Other changes by type
     for commit_type, label in type_labels.items():
-        commits_of_type = by_type.get(commit_type, [])
-        # Filter out breaking (already listed)
-        commits_of_type = [c for c in commits_of_type if not c.is_breaking]
-
+        commits_of_type = by_type.get(commit_type)
         if commits_of_type:
             lines.append(f"### {label}")
             lines.append("")
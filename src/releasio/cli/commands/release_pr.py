@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING, Any
 from rich.panel import Panel
 
 from releasio.config import load_config
-from releasio.core.commits import calculate_bump, filter_skip_release_commits, parse_commits
+from releasio.core.commits import calculate_bump, parse_commits
 from releasio.core.version import Version
 from releasio.exceptions import (
     ConfigError,
@@ -76,27 +76,26 @@ def run_release_pr(
     # Detect first release (no existing tags)
     is_first_release = latest_tag is None
 
-    # Get commits since last tag
-    commits = repo.get_commits_since_tag(latest_tag)
+    # Get commits since last tag; git drops commits with skip release markers
+    commits = repo.get_commits_since_tag(
+        latest_tag, skip_patterns=config.commits.skip_release_patterns
+    )
 
     if not commits:
-        console.print(
-            Panel(
-                "[yellow]No commits found since last release.[/]\n\n"
-                "Make some commits and try again.",
-                title="No Changes",
-                border_style="yellow",
+        if repo.get_commits_since_tag(latest_tag):
+            console.print(
+                Panel(
+                    "[yellow]All commits have skip release markers.[/]\n\nNo release needed.",
+                    title="No Changes",
+                    border_style="yellow",
+                )
             )
-        )
-        return
+            return
 
-    # Filter out commits with skip release markers
-    commits = filter_skip_release_commits(commits, config.commits.skip_release_patterns)
-
-    if not commits:
         console.print(
             Panel(
-                "[yellow]All commits have skip release markers.[/]\n\nNo release needed.",
+                "[yellow]No commits found since last release.[/]\n\n"
+                "Make some commits and try again.",
                 title="No Changes",
                 border_style="yellow",
             )
@@ -206,7 +205,7 @@ def run_release_pr(
         console.print(f"  • Branch: [cyan]{config.github.release_pr_branch}[/]")
 
         # Create release branch and make changes
-        from releasio.core.changelog import generate_changelog
+        from releasio.core.changelog import generate_changelog, prepend_changelog
         from releasio.project.pyproject import (
             detect_version_files,
             update_pyproject_version,
@@ -277,22 +276,17 @@ def run_release_pr(
 
         # Generate changelog with GitHub integration for PR links and @usernames
         github_repo_str = f"{github_owner}/{github_repo}"
+        changelog_path = project_path / config.changelog.path
         changelog_content = generate_changelog(
             repo=repo,
             version=next_version,
             config=config,
             github_repo=github_repo_str,
             console=console,
+            output_path=changelog_path,
         )
-        changelog_path = project_path / config.changelog.path
-
-        if changelog_path.exists():
-            existing = changelog_path.read_text()
-            new_content = changelog_content + "\n" + existing
-        else:
-            new_content = changelog_content
-
-        changelog_path.write_text(new_content)
+        if changelog_content is not None:
+            prepend_changelog(changelog_path, changelog_content)
         console.print(f"  [green]✓[/] Updated {config.changelog.path}")
         files_to_commit.append(changelog_path)
 
@@ -531,11 +525,13 @@ def _generate_pr_body(
     by_type: dict[str, list[ParsedCommit]] = {}
     breaking: list[ParsedCommit] = []
 
+    # Breaking commits are listed once, in their own section, so they are
+    # kept out of the per-type buckets
     for pc in parsed_commits:
         if pc.is_breaking:
             breaking.append(pc)
-        commit_type = pc.commit_type or "other"
-        by_type.setdefault(commit_type, []).append(pc)
+        else:
+            by_type.setdefault(pc.commit_type or "other", []).append(pc)
 
     # Type labels with emojis for professional look
     type_labels = {
@@ -567,10 +563,7 @@ def _generate_pr_body(
 
     # Other changes by type
     for commit_type, label in type_labels.items():
-        commits_of_type = by_type.get(commit_type, [])
-        # Filter out breaking (already listed)
-        commits_of_type = [c for c in commits_of_type if not c.is_breaking]
-
+        commits_of_type = by_type.get(commit_type)
         if commits_of_type:
             lines.append(f"### {label}")
             lines.append("")
@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING
 from rich.panel import Panel
 
 from releasio.config import load_config
-from releasio.core.commits import calculate_bump, filter_skip_release_commits, parse_commits
+from releasio.core.commits import calculate_bump, parse_commits
 from releasio.core.version import BumpType, Version
 from releasio.exceptions import (
     ConfigError,
@@ -22,6 +22,8 @@ from releasio.exceptions import (
 from releasio.vcs import GitRepository
 
 if TYPE_CHECKING:
+    import subprocess
+
     from rich.console import Console
 
 
@@ -84,18 +86,17 @@ def run_update(
     # Detect first release (no existing tags)
     is_first_release = latest_tag is None
 
-    # Get commits since last tag
-    commits = repo.get_commits_since_tag(latest_tag)
+    # Get commits since last tag; git drops commits with skip release markers
+    commits = repo.get_commits_since_tag(
+        latest_tag, skip_patterns=config.commits.skip_release_patterns
+    )
 
     if not commits:
-        console.print("[yellow]No commits found since last release. Nothing to do.[/]")
-        return
-
-    # Filter out commits with skip release markers
-    commits = filter_skip_release_commits(commits, config.commits.skip_release_patterns)
+        if repo.get_commits_since_tag(latest_tag):
+            console.print("[yellow]All commits have skip release markers. Nothing to do.[/]")
+            return
 
-    if not commits:
-        console.print("[yellow]All commits have skip release markers. Nothing to do.[/]")
+        console.print("[yellow]No commits found since last release. Nothing to do.[/]")
         return
 
     # Parse commits and calculate bump
@@ -172,15 +173,11 @@ def run_update(
             console,
             err_console,
             "pre-bump",
+            parallel=config.hooks.parallel,
         )
 
     # Actually apply changes
-    from releasio.project.pyproject import (
-        detect_version_files,
-        update_pyproject_version,
-        update_version_file,
-        update_version_in_plain_file,
-    )
+    from releasio.project.pyproject import detect_version_files, update_pyproject_version
 
     try:
         update_pyproject_version(project_path, str(next_version))
@@ -190,35 +187,30 @@ def run_update(
         raise SystemExit(1) from e
 
     # Update additional version files (explicitly configured)
-    for version_file in config.version.version_files:
-        version_file_path = project_path / version_file
-        try:
-            if version_file_path.name == "VERSION":
-                update_version_in_plain_file(version_file_path, str(next_version))
-            else:
-                update_version_file(version_file_path, str(next_version))
-            console.print(f"  [green]✓[/] Updated version in {version_file}")
-        except Exception as e:
-            err_console.print(f"[red]Error updating {version_file}:[/] {e}")
-            raise SystemExit(1) from e
+    explicit_paths = [project_path / version_file for version_file in config.version.version_files]
+    explicit_errors = _update_version_files(explicit_paths, str(next_version))
+    for version_file, error in zip(config.version.version_files, explicit_errors, strict=True):
+        if error is not None:
+            err_console.print(f"[red]Error updating {version_file}:[/] {error}")
+            raise SystemExit(1) from error
+        console.print(f"  [green]✓[/] Updated version in {version_file}")
 
     # Auto-detect and update version files if enabled
     if config.version.auto_detect_version_files:
-        detected_files = detect_version_files(project_path)
-        for version_file_path in detected_files:
-            # Skip if already in explicit list
+        # Skip files that are already in the explicit list
+        detected_paths = [
+            version_file_path
+            for version_file_path in detect_version_files(project_path)
+            if version_file_path.relative_to(project_path) not in config.version.version_files
+        ]
+        detected_errors = _update_version_files(detected_paths, str(next_version))
+        for version_file_path, error in zip(detected_paths, detected_errors, strict=True):
             relative_path = version_file_path.relative_to(project_path)
-            if relative_path in config.version.version_files:
-                continue
-            try:
-                if version_file_path.name == "VERSION":
-                    update_version_in_plain_file(version_file_path, str(next_version))
-                else:
-                    update_version_file(version_file_path, str(next_version))
-                console.print(f"  [green]✓[/] Updated version in {relative_path} (auto-detected)")
-            except Exception as e:
+            if error is not None:
                 # Non-fatal for auto-detected files
-                console.print(f"  [yellow]⚠[/] Could not update {relative_path}: {e}")
+                console.print(f"  [yellow]⚠[/] Could not update {relative_path}: {error}")
+            else:
+                console.print(f"  [green]✓[/] Updated version in {relative_path} (auto-detected)")
 
     # Update lock file if enabled
     if config.version.update_lock_file:
@@ -234,7 +226,7 @@ def run_update(
     # Generate changelog (if enabled)
     if config.changelog.enabled:
         try:
-            from releasio.core.changelog import generate_changelog
+            from releasio.core.changelog import generate_changelog, prepend_changelog
 
             # Try to get GitHub repo for richer changelog
             github_repo_str: str | None = None
@@ -249,25 +241,21 @@ def run_update(
                     "Changelog will not include PR links.[/]"
                 )
 
+            changelog_path = project_path / config.changelog.path
             changelog_content = generate_changelog(
                 repo=repo,
                 version=next_version,
                 config=config,
                 github_repo=github_repo_str,
                 console=console,
+                parsed_commits=parsed,
+                output_path=changelog_path,
             )
 
-            # Write changelog
-            changelog_path = project_path / config.changelog.path
-            if changelog_path.exists():
-                existing = changelog_path.read_text()
-                # Insert new content after header
-                # This is a simplified approach; git-cliff handles this better
-                new_content = changelog_content + "\n" + existing
-            else:
-                new_content = changelog_content
-
-            changelog_path.write_text(new_content)
+            # Write changelog (new content goes on top of the existing file),
+            # unless git-cliff already streamed it there
+            if changelog_content is not None:
+                prepend_changelog(changelog_path, changelog_content)
             console.print(f"  [green]✓[/] Updated {config.changelog.path}")
         except Exception as e:
             err_console.print(f"[red]Error generating changelog:[/] {e}")
@@ -286,6 +274,7 @@ def run_update(
             console,
             err_console,
             "post-bump",
+            parallel=config.hooks.parallel,
         )
 
     console.print(
@@ -302,6 +291,38 @@ def run_update(
     )
 
 
+def _update_version_files(paths: list[Path], new_version: str) -> list[Exception | None]:
+    """Update the version in several independent files concurrently.
+
+    Args:
+        paths: Version files to update (VERSION files are rewritten as plain text)
+        new_version: New version string
+
+    Returns:
+        One entry per path, in the same order: None on success, otherwise
+        the exception raised while updating that file
+    """
+    if not paths:
+        return []
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    from releasio.project.pyproject import update_version_file, update_version_in_plain_file
+
+    def update(path: Path) -> Exception | None:
+        try:
+            if path.name == "VERSION":
+                update_version_in_plain_file(path, new_version)
+            else:
+                update_version_file(path, new_version)
+        except Exception as e:
+            return e
+        return None
+
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        return list(executor.map(update, paths))
+
+
 def _run_hooks(
     hooks: list[str],
     project_path: Path,
@@ -311,6 +332,8 @@ def _run_hooks(
     console: Console,
     err_console: Console,
     hook_name: str,
+    *,
+    parallel: bool = False,
 ) -> None:
     """Run hook commands with template variable substitution.
 
@@ -323,29 +346,31 @@ def _run_hooks(
         console: Console for output
         err_console: Console for error output
         hook_name: Name of the hook phase (for logging)
+        parallel: Run the commands concurrently instead of one after another
     """
     import subprocess
 
-    template_vars = {
-        "version": str(new_version),
-        "prev_version": str(prev_version),
-        "bump_type": str(bump_type),
-    }
+    version = str(new_version)
+    previous = str(prev_version)
+    bump = str(bump_type)
+
+    # Substitute template variables; other braces (e.g. shell ${VAR}) are left as-is
+    expanded_cmds = [
+        cmd.replace("{version}", version)
+        .replace("{prev_version}", previous)
+        .replace("{bump_type}", bump)
+        for cmd in hooks
+    ]
 
-    for cmd in hooks:
-        # Substitute template variables
-        expanded_cmd = cmd.format(**template_vars)
+    if parallel and len(expanded_cmds) > 1:
+        _run_hooks_parallel(expanded_cmds, project_path, console, err_console, hook_name)
+        return
+
+    for expanded_cmd in expanded_cmds:
         console.print(f"  [dim]Running {hook_name} hook:[/] {expanded_cmd}")
 
         try:
-            result = subprocess.run(
-                expanded_cmd,
-                shell=True,
-                cwd=project_path,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            result = _run_hook_command(expanded_cmd, project_path)
             if result.stdout:
                 console.print(f"    [dim]{result.stdout.strip()}[/]")
         except subprocess.CalledProcessError as e:
@@ -353,3 +378,67 @@ def _run_hooks(
             if e.stderr:
                 err_console.print(f"[red]{e.stderr}[/]")
             raise SystemExit(1) from e
+
+
+def _run_hooks_parallel(
+    expanded_cmds: list[str],
+    project_path: Path,
+    console: Console,
+    err_console: Console,
+    hook_name: str,
+) -> None:
+    """Run already-expanded hook commands concurrently.
+
+    Output is printed in the configured command order once all commands
+    have finished. The first failure cancels commands that have not
+    started yet and aborts with exit code 1.
+
+    Args:
+        expanded_cmds: Shell commands with template variables substituted
+        project_path: Working directory for commands
+        console: Console for output
+        err_console: Console for error output
+        hook_name: Name of the hook phase (for logging)
+    """
+    import subprocess
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    for expanded_cmd in expanded_cmds:
+        console.print(f"  [dim]Running {hook_name} hook:[/] {expanded_cmd}")
+
+    executor = ThreadPoolExecutor(max_workers=min(8, len(expanded_cmds)))
+    try:
+        futures = {
+            executor.submit(_run_hook_command, expanded_cmd, project_path): expanded_cmd
+            for expanded_cmd in expanded_cmds
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except subprocess.CalledProcessError as e:
+                executor.shutdown(wait=False, cancel_futures=True)
+                err_console.print(f"[red]Hook failed:[/] {futures[future]}")
+                if e.stderr:
+                    err_console.print(f"[red]{e.stderr}[/]")
+                raise SystemExit(1) from e
+    finally:
+        executor.shutdown(wait=True)
+
+    for future in futures:
+        stdout = future.result().stdout
+        if stdout:
+            console.print(f"    [dim]{stdout.strip()}[/]")
+
+
+def _run_hook_command(expanded_cmd: str, project_path: Path) -> subprocess.CompletedProcess[str]:
+    """Run a single hook command, raising CalledProcessError on failure."""
+    import subprocess
+
+    return subprocess.run(
+        expanded_cmd,
+        shell=True,
+        cwd=project_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
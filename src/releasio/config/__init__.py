@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from releasio.config.loader import load_config
+from releasio.config.loader import clear_config_cache, load_config
 from releasio.config.models import (
     ChangelogConfig,
     CommitsConfig,
@@ -21,5 +21,6 @@ __all__ = [
     "PublishConfig",
     "ReleasePyConfig",
     "VersionConfig",
+    "clear_config_cache",
     "load_config",
 ]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import tomllib
 from dataclasses import dataclass
 from enum import Enum
@@ -45,16 +46,15 @@ def find_pyproject_toml(start_path: Path | None = None) -> Path:
     """
     current = (start_path or Path.cwd()).resolve()
 
-    while current != current.parent:
-        pyproject = current / "pyproject.toml"
-        if pyproject.is_file():
-            return pyproject
-        current = current.parent
-
-    # Check root as well
-    pyproject = current / "pyproject.toml"
-    if pyproject.is_file():
-        return pyproject
+    # One stat per directory, up to and including the filesystem root
+    for directory in (current, *current.parents):
+        pyproject = directory / "pyproject.toml"
+        try:
+            if pyproject.is_file():
+                return pyproject
+        except PermissionError:
+            # Unreadable ancestor: keep walking up
+            continue
 
     raise ConfigNotFoundError(
         f"No pyproject.toml found in {start_path or Path.cwd()} or any parent directory"
@@ -155,6 +155,11 @@ def load_pyproject_toml(path: Path) -> dict[str, Any]:
     Deprecated: Use load_toml_file() for general TOML loading.
     Kept for backward compatibility.
 
+    Parsed data is memoized per file, keyed on its inode, modification time
+    and size, so get_project_name() and get_project_version() share a single
+    parse. The returned dict is shared between callers and must be treated
+    as read-only.
+
     Args:
         path: Path to pyproject.toml
 
@@ -165,6 +170,36 @@ def load_pyproject_toml(path: Path) -> dict[str, Any]:
         ConfigNotFoundError: If file doesn't exist
         ConfigValidationError: If TOML parsing fails
     """
+    return _load_toml_cached(path, *_file_cache_key(path))
+
+
+def _file_cache_key(path: Path) -> tuple[int, int, int]:
+    """Return the inode, modification time and size that key the file caches.
+
+    The inode is included because version updates usually replace
+    pyproject.toml atomically, which yields a new inode even within one
+    mtime tick. Updates written in place (e.g. to hard-linked files) keep
+    the inode but always leave a strictly newer mtime.
+
+    Raises:
+        ConfigNotFoundError: If the file cannot be stat'ed
+    """
+    try:
+        stat = path.stat()
+    except OSError as e:
+        raise ConfigNotFoundError(f"File not found: {path}") from e
+
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=32)
+def _load_toml_cached(
+    path: Path,
+    _ino: int,
+    _mtime_ns: int,
+    _size: int,
+) -> dict[str, Any]:
+    """Parse a TOML file; the stat fields from _file_cache_key() only key the cache."""
     return load_toml_file(path)
 
 
@@ -220,6 +255,11 @@ def load_config(path: Path | None = None) -> ReleasePyConfig:
     Custom config files contain only releasio settings (no [tool] wrapper).
     pyproject.toml is always required for project name/version metadata.
 
+    Parsed configurations are memoized per config file, keyed on the file's
+    inode, modification time and size, so repeated loads within a process
+    skip TOML parsing and validation until the file changes. The returned instance is
+    shared between callers and must be treated as read-only.
+
     Args:
         path: Path to config file, or directory to search from.
               If None, searches from current directory.
@@ -242,7 +282,30 @@ def load_config(path: Path | None = None) -> ReleasePyConfig:
         >>> config = load_config(Path("/path/to/.releasio.toml"))
     """
     start_path = (path or Path.cwd()).resolve()
+    config_file, source = _resolve_config_file(start_path)
+
+    return _load_config_cached(config_file, source, *_file_cache_key(config_file))
+
+
+def clear_config_cache() -> None:
+    """Clear the memoized results of load_config() and load_pyproject_toml()."""
+    _load_config_cached.cache_clear()
+    _load_toml_cached.cache_clear()
+
+
+def _resolve_config_file(start_path: Path) -> tuple[Path, ConfigSource]:
+    """Determine which config file load_config() should read.
+
+    Args:
+        start_path: Resolved config file path or directory to search from
+
+    Returns:
+        Tuple of (config file path, config source)
 
+    Raises:
+        ConfigNotFoundError: If no configuration found
+        ConfigValidationError: If an unsupported config file was given
+    """
     # Handle direct file path
     if start_path.is_file():
         # User specified exact config file
@@ -252,7 +315,6 @@ def load_config(path: Path | None = None) -> ReleasePyConfig:
                 source = ConfigSource.DOTFILE
             else:
                 source = ConfigSource.VISIBLE
-            config_data = load_toml_file(start_path)
 
             # Still need pyproject.toml for project metadata
             try:
@@ -264,26 +326,42 @@ def load_config(path: Path | None = None) -> ReleasePyConfig:
                     "releasio requires pyproject.toml for project name and version."
                 ) from e
 
-        elif start_path.name == "pyproject.toml":
+            return start_path, source
+
+        if start_path.name == "pyproject.toml":
             # pyproject.toml specified directly
-            source = ConfigSource.PYPROJECT
-            config_data = load_toml_file(start_path)
-        else:
-            raise ConfigValidationError(
-                f"Unsupported config file: {start_path.name}. "
-                "Expected .releasio.toml, releasio.toml, or pyproject.toml"
-            )
-    else:
-        # Directory path: discover config
-        config_paths = find_releasio_config(start_path)
-        if not config_paths:
-            raise ConfigNotFoundError(
-                f"No releasio configuration found in {start_path} or parent directories. "
-                "Expected .releasio.toml, releasio.toml, or [tool.releasio] in pyproject.toml"
-            )
+            return start_path, ConfigSource.PYPROJECT
+
+        raise ConfigValidationError(
+            f"Unsupported config file: {start_path.name}. "
+            "Expected .releasio.toml, releasio.toml, or pyproject.toml"
+        )
+
+    # Directory path: discover config
+    config_paths = find_releasio_config(start_path)
+    if not config_paths:
+        raise ConfigNotFoundError(
+            f"No releasio configuration found in {start_path} or parent directories. "
+            "Expected .releasio.toml, releasio.toml, or [tool.releasio] in pyproject.toml"
+        )
+
+    return config_paths.config_file, config_paths.config_source
+
 
-        config_data = load_toml_file(config_paths.config_file)
-        source = config_paths.config_source
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(
+    config_file: Path,
+    source: ConfigSource,
+    _ino: int,
+    _mtime_ns: int,
+    _size: int,
+) -> ReleasePyConfig:
+    """Parse and validate a config file.
+
+    The stat fields from _file_cache_key() are only part of the cache key,
+    so an edited or replaced file is re-read on the next load_config() call.
+    """
+    config_data = load_toml_file(config_file)
 
     # Extract releasio config based on source
     releasio_data = extract_releasio_config(config_data, source)
@@ -298,9 +376,8 @@ def load_config(path: Path | None = None) -> ReleasePyConfig:
             msg = error["msg"]
             errors.append(f"  - {loc}: {msg}")
 
-        config_file_name = start_path.name if start_path.is_file() else source.value
         raise ConfigValidationError(
-            f"Invalid configuration in {config_file_name}:\n" + "\n".join(errors)
+            f"Invalid configuration in {config_file.name}:\n" + "\n".join(errors)
         ) from e
 
 
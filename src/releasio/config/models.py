@@ -32,7 +32,7 @@ class BranchConfig(BaseModel):
         description="Pre-release token to use (e.g., 'alpha', 'beta', 'rc')",
     )
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
     def matches_branch(self, branch_name: str) -> bool:
         """Check if this config matches the given branch name.
@@ -93,7 +93,7 @@ class CommitParser(BaseModel):
         ),
     )
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class CommitsConfig(BaseModel):
@@ -142,7 +142,7 @@ class CommitsConfig(BaseModel):
         ),
     )
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class ChangelogConfig(BaseModel):
@@ -259,7 +259,7 @@ class ChangelogConfig(BaseModel):
         ),
     )
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class VersionConfig(BaseModel):
@@ -296,7 +296,7 @@ class VersionConfig(BaseModel):
         ),
     )
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class GitHubConfig(BaseModel):
@@ -375,7 +375,7 @@ class GitHubConfig(BaseModel):
         ),
     )
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class PublishConfig(BaseModel):
@@ -406,7 +406,7 @@ class PublishConfig(BaseModel):
         description="Check if version already exists on PyPI before publishing",
     )
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class PackagesConfig(BaseModel):
@@ -421,7 +421,7 @@ class PackagesConfig(BaseModel):
         description="Use independent versioning per package",
     )
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class HooksConfig(BaseModel):
@@ -455,8 +455,15 @@ class HooksConfig(BaseModel):
             "Available variables: {version}, {project_path}"
         ),
     )
+    parallel: bool = Field(
+        default=False,
+        description=(
+            "Run pre_bump/post_bump commands concurrently. "
+            "Only enable when the commands do not depend on each other."
+        ),
+    )
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class SecurityConfig(BaseModel):
@@ -482,7 +489,7 @@ class SecurityConfig(BaseModel):
         description="Regex patterns to detect security-related commits",
     )
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class ReleasePyConfig(BaseModel):
@@ -519,7 +526,7 @@ class ReleasePyConfig(BaseModel):
         ),
     )
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
     @property
     def is_monorepo(self) -> bool:
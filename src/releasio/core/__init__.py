@@ -9,17 +9,22 @@ This module contains the fundamental building blocks:
 
 from __future__ import annotations
 
-from releasio.core.changelog import generate_changelog, get_bump_from_git_cliff
+from typing import TYPE_CHECKING, Any
+
 from releasio.core.commits import (
     ParsedCommit,
     calculate_bump,
     format_commit_for_changelog,
     get_breaking_changes,
     group_commits_by_type,
+    make_commit_formatter,
     parse_commits,
 )
 from releasio.core.version import BumpType, PreRelease, Version, parse_version
 
+if TYPE_CHECKING:
+    from releasio.core.changelog import generate_changelog, get_bump_from_git_cliff
+
 __all__ = [
     # Version
     "BumpType",
@@ -34,6 +39,20 @@ __all__ = [
     "get_breaking_changes",
     "get_bump_from_git_cliff",
     "group_commits_by_type",
+    "make_commit_formatter",
     "parse_commits",
     "parse_version",
 ]
+
+# The changelog module pulls in subprocess/tempfile machinery that most
+# commands only need once they actually write a release, so it is loaded
+# on first access rather than whenever releasio.core is imported.
+_LAZY_CHANGELOG_EXPORTS = frozenset({"generate_changelog", "get_bump_from_git_cliff"})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_CHANGELOG_EXPORTS:
+        from releasio.core import changelog
+
+        return getattr(changelog, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
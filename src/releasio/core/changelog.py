@@ -4,8 +4,8 @@ This module wraps git-cliff for generating beautiful, customizable
 changelogs from conventional commits. When git-cliff is unavailable,
 a native fallback generator is used.
 
-git-cliff is called as a subprocess and its output is captured
-for further processing.
+git-cliff is called as a subprocess and its output is either captured
+for further processing or streamed straight into the changelog file.
 
 Key features:
 - Changelog generation with GitHub integration (PR links, usernames)
@@ -17,10 +17,14 @@ Key features:
 
 from __future__ import annotations
 
+import contextlib
+import io
+import os
 import shutil
 import subprocess
+import tempfile
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, overload
 
 from rich.console import Console  # Used at runtime for console.status()
 
@@ -28,6 +32,10 @@ from releasio.core.version import BumpType
 from releasio.exceptions import ChangelogError, GitCliffError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+    from typing import BinaryIO
+
     from releasio.config.models import ChangelogConfig, ReleasePyConfig
     from releasio.core.version import Version
     from releasio.vcs.git import GitRepository
@@ -114,6 +122,34 @@ def _parse_bump_type(output: str) -> BumpType:
     return BumpType.NONE
 
 
+@overload
+def generate_changelog(
+    repo: GitRepository,
+    version: Version,
+    config: ReleasePyConfig,
+    *,
+    unreleased_only: bool = ...,
+    github_repo: str | None = ...,
+    console: Console | None = ...,
+    parsed_commits: list[ParsedCommit] | None = ...,
+    output_path: None = ...,
+) -> str: ...
+
+
+@overload
+def generate_changelog(
+    repo: GitRepository,
+    version: Version,
+    config: ReleasePyConfig,
+    *,
+    unreleased_only: bool = ...,
+    github_repo: str | None = ...,
+    console: Console | None = ...,
+    parsed_commits: list[ParsedCommit] | None = ...,
+    output_path: Path,
+) -> str | None: ...
+
+
 def generate_changelog(
     repo: GitRepository,
     version: Version,
@@ -123,7 +159,8 @@ def generate_changelog(
     github_repo: str | None = None,
     console: Console | None = None,
     parsed_commits: list[ParsedCommit] | None = None,
-) -> str:
+    output_path: Path | None = None,
+) -> str | None:
     """Generate changelog content using git-cliff with native fallback.
 
     Args:
@@ -136,9 +173,13 @@ def generate_changelog(
         console: Rich console for progress indicators (optional)
         parsed_commits: Pre-parsed commits for native fallback (optional, will be
                        fetched and parsed if not provided and fallback needed)
+        output_path: Changelog file to prepend git-cliff output to (optional).
+                    When set and git-cliff is used, its output is streamed
+                    straight into the file instead of being returned.
 
     Returns:
-        Generated changelog content as string
+        Generated changelog content as string, or None if the content was
+        already written to ``output_path``
 
     Raises:
         GitCliffError: If git-cliff command fails
@@ -153,6 +194,7 @@ def generate_changelog(
                 unreleased_only=unreleased_only,
                 github_repo=github_repo,
                 console=console,
+                output_path=output_path,
             )
         except FileNotFoundError:
             # Shouldn't happen since we checked, but handle it anyway
@@ -200,7 +242,9 @@ def _run_git_cliff(
     unreleased_only: bool,
     github_repo: str | None = None,
     console: Console | None = None,
-) -> str:
+    *,
+    output_path: Path | None = None,
+) -> str | None:
     """Run git-cliff subprocess.
 
     Args:
@@ -209,9 +253,10 @@ def _run_git_cliff(
         unreleased_only: Only unreleased changes
         github_repo: GitHub repo in "owner/repo" format for GitHub integration
         console: Rich console for progress indicators (optional)
+        output_path: Changelog file to prepend the output to (optional)
 
     Returns:
-        Changelog content
+        Changelog content, or None if it was streamed into ``output_path``
     """
     args = [
         "git-cliff",
@@ -234,30 +279,124 @@ def _run_git_cliff(
     if pyproject_path.exists():
         args.extend(["--config", str(pyproject_path)])
 
-    try:
-        if console:
-            with console.status("[bold blue]Generating changelog...", spinner="dots"):
-                result = subprocess.run(
-                    args,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    cwd=repo.path,
-                )
-        else:
+    status = (
+        console.status("[bold blue]Generating changelog...", spinner="dots")
+        if console
+        else contextlib.nullcontext()
+    )
+    # Raw bytes: stdout is decoded once on success, stderr only on failure
+    with status:
+        if output_path is None:
             result = subprocess.run(
                 args,
                 capture_output=True,
-                text=True,
-                check=True,
+                check=False,
                 cwd=repo.path,
             )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError as e:
+            _check_git_cliff_result(result)
+            return result.stdout.decode().strip()
+
+        # Let git-cliff write straight into the file that will replace
+        # the changelog, so its output never passes through Python
+        with _prepending_writer(output_path) as out:
+            result = subprocess.run(
+                args,
+                stdout=out,
+                stderr=subprocess.PIPE,
+                check=False,
+                cwd=repo.path,
+            )
+            _check_git_cliff_result(result)
+            _ensure_trailing_newline(out)
+        return None
+
+
+def _check_git_cliff_result(result: subprocess.CompletedProcess[bytes]) -> None:
+    """Raise GitCliffError if a git-cliff run exited with a non-zero status."""
+    if result.returncode != 0:
         raise GitCliffError(
-            f"git-cliff failed with exit code {e.returncode}",
-            stderr=e.stderr,
-        ) from e
+            f"git-cliff failed with exit code {result.returncode}",
+            stderr=result.stderr.decode(errors="replace"),
+        )
+
+
+def prepend_changelog(changelog_path: Path, content: str) -> None:
+    """Prepend new changelog content to the changelog file.
+
+    The new content is written to a temporary file next to the changelog,
+    the existing changelog is streamed after it, and the temporary file
+    then atomically replaces the original. The existing changelog is never
+    loaded into memory, and an interrupted write leaves it untouched.
+
+    Content is always written as UTF-8, whatever the locale encoding.
+    Empty content leaves the changelog untouched.
+
+    Args:
+        changelog_path: Path to the changelog file (created if missing)
+        content: New changelog content to place at the top
+    """
+    if not content:
+        return
+
+    if not changelog_path.exists():
+        changelog_path.write_bytes(content.encode())
+        return
+
+    with _prepending_writer(changelog_path) as out:
+        out.write(content.encode())
+        out.write(b"\n")
+
+
+@contextlib.contextmanager
+def _prepending_writer(changelog_path: Path) -> Iterator[BinaryIO]:
+    """Yield a binary file whose contents end up at the top of the changelog.
+
+    If the changelog does not exist yet it is written directly. Otherwise
+    a temporary file next to it is yielded; on a clean exit the existing
+    changelog is streamed after whatever was written and the temporary
+    file atomically replaces the original. On error the changelog is left
+    untouched.
+
+    Args:
+        changelog_path: Path to the changelog file
+
+    Yields:
+        File object to write the new content to
+    """
+    if not changelog_path.exists():
+        try:
+            with changelog_path.open("w+b") as new_file:
+                yield new_file
+        except BaseException:
+            changelog_path.unlink(missing_ok=True)
+            raise
+        return
+
+    fd, tmp_name = tempfile.mkstemp(
+        dir=changelog_path.parent,
+        prefix=f".{changelog_path.name}.",
+        suffix=".tmp",
+    )
+    try:
+        with os.fdopen(fd, "w+b") as tmp_file:
+            yield tmp_file
+            with changelog_path.open("rb") as existing:
+                shutil.copyfileobj(existing, tmp_file)
+        shutil.copymode(changelog_path, tmp_name)
+        os.replace(tmp_name, changelog_path)  # noqa: PTH105
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)  # noqa: PTH108
+        raise
+
+
+def _ensure_trailing_newline(out: BinaryIO) -> None:
+    """Terminate the last line written by a subprocess, if it is not already."""
+    end = out.seek(0, os.SEEK_END)
+    if end:
+        out.seek(end - 1)
+        if out.read(1) != b"\n":
+            out.write(b"\n")
 
 
 # =============================================================================
@@ -633,27 +772,26 @@ def generate_native_changelog(
         grouped.setdefault(group_key, []).append(pc)
 
     # Build changelog content
-    lines: list[str] = []
+    buf = io.StringIO()
+
+    def write_section(header: str, commits: list[ParsedCommit]) -> None:
+        buf.write(f"### {header}\n\n")
+        for pc in commits:
+            entry = format_commit_entry(pc, config, first_time_contributors=first_time_contributors)
+            buf.write(f"- {entry}\n")
+        buf.write("\n")
 
     # Add custom header if configured
     if config.header:
-        lines.append(config.header.rstrip())
-        lines.append("")
+        buf.write(f"{config.header.rstrip()}\n\n")
 
     # Header with version and date
     today = datetime.now(tz=UTC).strftime("%Y-%m-%d")
-    lines.append(f"## [{version}] - {today}")
-    lines.append("")
+    buf.write(f"## [{version}] - {today}\n\n")
 
     # Breaking changes section first (if any)
     if breaking:
-        header = config.section_headers.get("breaking", "⚠️ Breaking Changes")
-        lines.append(f"### {header}")
-        lines.append("")
-        for pc in breaking:
-            entry = format_commit_entry(pc, config, first_time_contributors=first_time_contributors)
-            lines.append(f"- {entry}")
-        lines.append("")
+        write_section(config.section_headers.get("breaking", "⚠️ Breaking Changes"), breaking)
 
     # Other sections in config order
     section_order = [
@@ -670,50 +808,28 @@ def generate_native_changelog(
     ]
 
     for commit_type in section_order:
-        commits = grouped.get(commit_type, [])
-        if not commits:
-            continue
-
-        header = config.section_headers.get(commit_type, commit_type.title())
-        lines.append(f"### {header}")
-        lines.append("")
-        for pc in commits:
-            entry = format_commit_entry(pc, config, first_time_contributors=first_time_contributors)
-            lines.append(f"- {entry}")
-        lines.append("")
+        commits = grouped.get(commit_type)
+        if commits:
+            write_section(config.section_headers.get(commit_type, commit_type.title()), commits)
 
     # Any custom groups not in standard order
     custom_groups = set(grouped.keys()) - set(section_order) - {"breaking", "other"}
     for group_key in sorted(custom_groups):
-        commits = grouped[group_key]
         # For custom groups from parsers, use the group name as header
-        header = config.section_headers.get(group_key, group_key)
-        lines.append(f"### {header}")
-        lines.append("")
-        for pc in commits:
-            entry = format_commit_entry(pc, config, first_time_contributors=first_time_contributors)
-            lines.append(f"- {entry}")
-        lines.append("")
+        write_section(config.section_headers.get(group_key, group_key), grouped[group_key])
 
     # "Other" section last
-    other_commits = grouped.get("other", [])
+    other_commits = grouped.get("other")
     if other_commits:
-        header = config.section_headers.get("other", "📝 Other")
-        lines.append(f"### {header}")
-        lines.append("")
-        for pc in other_commits:
-            entry = format_commit_entry(pc, config, first_time_contributors=first_time_contributors)
-            lines.append(f"- {entry}")
-        lines.append("")
+        write_section(config.section_headers.get("other", "📝 Other"), other_commits)
 
     # Dependency updates section (if enabled and updates available)
     if config.include_dependency_updates and dependency_updates:
-        lines.append("### 📦 Dependencies")
-        lines.append("")
-        lines.extend(f"- {update}" for update in dependency_updates)
-        lines.append("")
+        buf.write("### 📦 Dependencies\n\n")
+        for update in dependency_updates:
+            buf.write(f"- {update}\n")
 
-    return "\n".join(lines).rstrip() + "\n"
+    return buf.getvalue().rstrip() + "\n"
 
 
 # =============================================================================
@@ -28,32 +28,47 @@ Custom Parser Support:
 from __future__ import annotations
 
 import contextlib
+import functools
 import re
+import sys
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from releasio.core.version import BumpType
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from releasio.config.models import CommitParser, CommitsConfig
     from releasio.vcs.git import Commit
 
 
-# Regex for parsing conventional commit subjects
+# Regex for parsing conventional commit subjects, applied with fullmatch().
+# Type case is folded by the callers, so no IGNORECASE flag is needed.
 _CONVENTIONAL_COMMIT_PATTERN = re.compile(
     r"""
-    ^
     (?P<type>[a-zA-Z]+)       # Type (feat, fix, etc.)
     (?:\((?P<scope>[^)]+)\))? # Optional scope in parentheses
     (?P<breaking>!)?          # Optional breaking change indicator
     :\s*                      # Colon and optional whitespace
     (?P<description>.+)       # Description
-    $
     """,
     re.VERBOSE,
 )
 
 
+def _match_conventional_header(text: str) -> re.Match[str] | None:
+    """Match a conventional commit header, skipping the regex when it cannot match.
+
+    Every header needs a colon, so subjects such as merge commits or plain
+    "Update README" messages are rejected with a substring check.
+    """
+    if ":" not in text:
+        return None
+    return _CONVENTIONAL_COMMIT_PATTERN.fullmatch(text)
+
+
 @dataclass(frozen=True, slots=True)
 class ParsedCommit:
     """A parsed conventional commit.
@@ -139,8 +154,7 @@ def _try_custom_parser(
         ParsedCommit if the parser matches, None otherwise
     """
     try:
-        pattern = re.compile(parser.pattern, re.MULTILINE)
-        match = pattern.match(commit.subject)
+        match = _compile_parser_pattern(parser.pattern).match(commit.subject)
 
         if not match:
             return None
@@ -163,7 +177,7 @@ def _try_custom_parser(
 
         # Also check for breaking change in body
         if not is_breaking and commit.body and breaking_pattern:
-            is_breaking = bool(re.search(breaking_pattern, commit.body, re.IGNORECASE))
+            is_breaking = bool(_compile_breaking_pattern(breaking_pattern).search(commit.body))
 
         return ParsedCommit(
             commit=commit,
@@ -179,6 +193,18 @@ def _try_custom_parser(
         return None
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_parser_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a custom parser's subject pattern once per distinct pattern."""
+    return re.compile(pattern, re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_breaking_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile the breaking-change body pattern once per distinct pattern."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
 def _parse_conventional_commit(
     commit: Commit,
     subject: str,
@@ -196,7 +222,7 @@ def _parse_conventional_commit(
     Returns:
         ParsedCommit instance
     """
-    match = _CONVENTIONAL_COMMIT_PATTERN.match(subject)
+    match = _match_conventional_header(subject)
 
     if not match:
         # Not a conventional commit
@@ -209,15 +235,20 @@ def _parse_conventional_commit(
             is_conventional=False,
         )
 
-    commit_type = match.group("type").lower()
+    # Types and scopes repeat across a history: intern them so thousands of
+    # commits share a handful of strings and later comparisons hit the
+    # identity fast path
+    commit_type = sys.intern(match.group("type").lower())
     scope = match.group("scope")
+    if scope is not None:
+        scope = sys.intern(scope)
     description = match.group("description")
     breaking_indicator = bool(match.group("breaking"))
 
     # Check for breaking change in body
     breaking_in_body = False
     if body and breaking_pattern:
-        breaking_in_body = bool(re.search(breaking_pattern, body, re.IGNORECASE))
+        breaking_in_body = bool(_compile_breaking_pattern(breaking_pattern).search(body))
 
     is_breaking = breaking_indicator or breaking_in_body
 
@@ -248,14 +279,19 @@ def filter_skip_release_commits(
     if not skip_patterns:
         return commits
 
-    filtered = []
+    # Markers are literal substrings: lowercase them once, then scan each
+    # message with plain substring checks instead of a regex. The inner
+    # for/else avoids building an any() generator per commit.
+    markers = tuple(pattern.lower() for pattern in skip_patterns)
+    kept = []
     for commit in commits:
-        message_lower = commit.message.lower()
-        should_skip = any(pattern.lower() in message_lower for pattern in skip_patterns)
-        if not should_skip:
-            filtered.append(commit)
-
-    return filtered
+        message = commit.message.lower()
+        for marker in markers:
+            if marker in message:
+                break
+        else:
+            kept.append(commit)
+    return kept
 
 
 def parse_commits(
@@ -275,26 +311,25 @@ def parse_commits(
     Returns:
         List of ParsedCommit instances
     """
-    parsed = []
-
     # Get custom parsers if configured
     custom_parsers = config.commit_parsers if config.commit_parsers else None
 
-    for commit in commits:
-        pc = ParsedCommit.from_commit(
+    parsed = [
+        ParsedCommit.from_commit(
             commit,
             config.breaking_pattern,
             custom_parsers=custom_parsers,
             use_conventional_fallback=config.use_conventional_fallback,
         )
+        for commit in commits
+    ]
 
-        # If scope filtering is enabled, skip non-matching commits
-        if config.scope_regex and pc.scope and not re.match(config.scope_regex, pc.scope):
-            continue
-
-        parsed.append(pc)
+    # If scope filtering is enabled, skip non-matching commits
+    if not config.scope_regex:
+        return parsed
 
-    return parsed
+    scope_re = re.compile(config.scope_regex)
+    return [pc for pc in parsed if not pc.scope or scope_re.match(pc.scope)]
 
 
 def calculate_bump(
@@ -320,8 +355,13 @@ def calculate_bump(
     if not parsed_commits:
         return BumpType.NONE
 
-    # Track the highest bump type seen
-    max_bump = BumpType.NONE
+    # Membership sets built once per call; the config holds lists
+    major_types = frozenset(config.types_major)
+    minor_types = frozenset(config.types_minor)
+    patch_types = frozenset(config.types_patch)
+
+    saw_minor = False
+    saw_patch = False
 
     for pc in parsed_commits:
         # Breaking changes always result in major bump
@@ -334,15 +374,18 @@ def calculate_bump(
         commit_type = pc.commit_type.lower()
 
         # Check configured bump types
-        if commit_type in config.types_major:
+        if commit_type in major_types:
             return BumpType.MAJOR
-        if commit_type in config.types_minor:
-            if max_bump.value in ("none", "patch"):
-                max_bump = BumpType.MINOR
-        elif commit_type in config.types_patch and max_bump == BumpType.NONE:
-            max_bump = BumpType.PATCH
+        if commit_type in minor_types:
+            saw_minor = True
+        elif commit_type in patch_types:
+            saw_patch = True
 
-    return max_bump
+    if saw_minor:
+        return BumpType.MINOR
+    if saw_patch:
+        return BumpType.PATCH
+    return BumpType.NONE
 
 
 def group_commits_by_type(
@@ -356,13 +399,12 @@ def group_commits_by_type(
     Returns:
         Dictionary mapping commit types to lists of commits
     """
-    grouped: dict[str, list[ParsedCommit]] = {}
+    grouped: defaultdict[str, list[ParsedCommit]] = defaultdict(list)
 
     for pc in parsed_commits:
-        commit_type = pc.commit_type or "other"
-        grouped.setdefault(commit_type, []).append(pc)
+        grouped[pc.commit_type or "other"].append(pc)
 
-    return grouped
+    return dict(grouped)
 
 
 def get_breaking_changes(parsed_commits: list[ParsedCommit]) -> list[ParsedCommit]:
@@ -393,28 +435,53 @@ def format_commit_for_changelog(
     Returns:
         Formatted string for changelog
     """
-    parts = []
+    return make_commit_formatter(include_sha=include_sha, include_scope=include_scope)(pc)
 
-    if include_scope and pc.scope:
-        parts.append(f"**{pc.scope}:** ")
 
-    if pc.is_breaking:
-        parts.append("[BREAKING] ")
+@functools.lru_cache(maxsize=4)
+def make_commit_formatter(
+    *,
+    include_sha: bool = False,
+    include_scope: bool = True,
+) -> Callable[[ParsedCommit], str]:
+    """Build a changelog line formatter with the option checks resolved up front.
 
-    parts.append(pc.description)
+    Use this when formatting many commits with the same options; the
+    returned function produces the same output as format_commit_for_changelog().
 
-    if include_sha:
-        parts.append(f" ({pc.commit.short_sha})")
+    Args:
+        include_sha: Whether to include the commit SHA
+        include_scope: Whether to include the scope
 
-    return "".join(parts)
+    Returns:
+        Function formatting a single parsed commit
+    """
+
+    def format_scoped(pc: ParsedCommit) -> str:
+        scope = f"**{pc.scope}:** " if pc.scope else ""
+        breaking = "[BREAKING] " if pc.is_breaking else ""
+        return f"{scope}{breaking}{pc.description}"
+
+    def format_unscoped(pc: ParsedCommit) -> str:
+        return f"[BREAKING] {pc.description}" if pc.is_breaking else pc.description
+
+    base = format_scoped if include_scope else format_unscoped
+    if not include_sha:
+        return base
+
+    def format_with_sha(pc: ParsedCommit) -> str:
+        return f"{base(pc)} ({pc.commit.short_sha})"
+
+    return format_with_sha
 
 
 # =============================================================================
 # PR Title Validation
 # =============================================================================
 
-# Default allowed commit types for PR titles
-DEFAULT_ALLOWED_TYPES = frozenset(
+# Default allowed commit types for PR titles. A frozenset hash lookup is
+# faster here than substring search over a packed "|feat|fix|..." string.
+DEFAULT_ALLOWED_TYPES: frozenset[str] = frozenset(
     [
         "feat",
         "fix",
@@ -503,7 +570,7 @@ def validate_pr_title(  # noqa: PLR0911
         )
 
     # Try to match conventional commit format
-    match = _CONVENTIONAL_COMMIT_PATTERN.match(title)
+    match = _match_conventional_header(title)
 
     if not match:
         return ValidationResult(
@@ -518,7 +585,7 @@ def validate_pr_title(  # noqa: PLR0911
 
     # Check allowed types
     if commit_type not in types:
-        allowed_list = ", ".join(sorted(types))
+        allowed_list = _format_allowed_types(frozenset(types))
         return ValidationResult(
             is_valid=False,
             error=f"Invalid commit type '{commit_type}'. Allowed: {allowed_list}",
@@ -560,6 +627,12 @@ def validate_pr_title(  # noqa: PLR0911
     )
 
 
+@functools.lru_cache(maxsize=8)
+def _format_allowed_types(types: frozenset[str]) -> str:
+    """Render the allowed types for error messages, once per distinct set."""
+    return ", ".join(sorted(types))
+
+
 def validate_pr_titles_batch(
     titles: list[str],
     allowed_types: frozenset[str] | None = None,
@@ -575,4 +648,5 @@ def validate_pr_titles_batch(
     Returns:
         List of ValidationResult for each title
     """
-    return [validate_pr_title(title, allowed_types, require_scope) for title in titles]
+    types = allowed_types or DEFAULT_ALLOWED_TYPES
+    return [validate_pr_title(title, types, require_scope) for title in titles]
@@ -21,7 +21,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from enum import Enum
-from functools import total_ordering
+from functools import lru_cache, total_ordering
 from typing import Self
 
 from releasio.exceptions import InvalidVersionError
@@ -173,9 +173,12 @@ class Version:
             raise InvalidVersionError(str(self), "Patch version cannot be negative")
 
     @classmethod
-    def parse(cls, version_str: str) -> Self:
+    @lru_cache(maxsize=256)
+    def parse(cls, version_str: str) -> Version:
         """Parse a version string into a Version object.
 
+        Results are memoized; this is safe because Version is immutable.
+
         Args:
             version_str: Version string (e.g., "1.2.3", "1.0.0a1")
 
@@ -3,8 +3,8 @@
 This module provides functionality for reading and updating
 the version number in pyproject.toml files and other version files.
 
-It preserves formatting and comments by using regex-based
-replacement rather than full TOML parsing and rewriting.
+Versions are read with tomllib. Updates preserve formatting and comments
+by using regex-based replacement rather than full TOML parsing and rewriting.
 
 Supported version file patterns:
 - pyproject.toml (PEP 621 and Poetry formats)
@@ -16,14 +16,21 @@ Supported version file patterns:
 
 from __future__ import annotations
 
+import contextlib
+import itertools
+import os
 import re
+import shutil
+import tempfile
+import tomllib
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from releasio.config.loader import find_pyproject_toml
 from releasio.exceptions import ProjectError, VersionNotFoundError
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Sequence
 
 
 # Common version file patterns to search for
@@ -41,6 +48,17 @@ VERSION_PATTERNS = [
     r'^version\s*=\s*["\']([^"\']+)["\']',
 ]
 
+_VERSION_REGEXES = tuple(re.compile(pat, re.MULTILINE) for pat in VERSION_PATTERNS)
+
+# Section headers that may hold the project version, in lookup order
+_VERSION_SECTIONS = ("[project]", "[tool.poetry]")
+
+# The version key within a single section
+_VERSION_IN_SECTION = re.compile(r'^(version\s*=\s*)["\'][^"\']+["\']', re.MULTILINE)
+
+# Default pattern for update_version_file(): __version__ = "..."
+_DUNDER_VERSION = re.compile(r'^(__version__\s*=\s*)["\'][^"\']+["\']', re.MULTILINE)
+
 
 def get_pyproject_version(path: Path | None = None) -> str:
     """Get the version from pyproject.toml.
@@ -53,6 +71,7 @@ def get_pyproject_version(path: Path | None = None) -> str:
 
     Raises:
         VersionNotFoundError: If version cannot be found
+        ProjectError: If pyproject.toml is not valid TOML
     """
     if path is None:
         pyproject_path = find_pyproject_toml()
@@ -61,25 +80,18 @@ def get_pyproject_version(path: Path | None = None) -> str:
     else:
         pyproject_path = path
 
-    content = pyproject_path.read_text()
-
-    # Try PEP 621 format first: [project] version = "..."
-    pep621_match = re.search(
-        r'^\[project\].*?^version\s*=\s*["\']([^"\']+)["\']',
-        content,
-        re.MULTILINE | re.DOTALL,
-    )
-    if pep621_match:
-        return pep621_match.group(1)
-
-    # Try Poetry format: [tool.poetry] version = "..."
-    poetry_match = re.search(
-        r'^\[tool\.poetry\].*?^version\s*=\s*["\']([^"\']+)["\']',
-        content,
-        re.MULTILINE | re.DOTALL,
+    try:
+        with pyproject_path.open("rb") as f:
+            data = tomllib.load(f)
+    except tomllib.TOMLDecodeError as e:
+        raise ProjectError(f"Invalid TOML in {pyproject_path}: {e}") from e
+
+    # Try PEP 621 format first, then Poetry format
+    version = data.get("project", {}).get("version") or (
+        data.get("tool", {}).get("poetry", {}).get("version")
     )
-    if poetry_match:
-        return poetry_match.group(1)
+    if isinstance(version, str):
+        return version
 
     raise VersionNotFoundError(
         f"Could not find version in {pyproject_path}. "
@@ -111,64 +123,27 @@ def update_pyproject_version(path: Path | None, new_version: str) -> Path:
     else:
         pyproject_path = path
 
-    content = pyproject_path.read_text()
+    # Decode the raw bytes as UTF-8 (no locale encoding, no newline
+    # translation) so everything but the version round-trips unchanged
+    content = pyproject_path.read_bytes().decode()
     original_content = content
 
-    # Try to update PEP 621 format
+    # Try PEP 621 format first, then Poetry
     updated = False
-
-    # Pattern for [project] section version
-    # This matches version = "..." within the [project] section
-    def replace_pep621(match: re.Match[str]) -> str:
-        section = match.group(0)
-        # Replace version within the matched section
-        return re.sub(
-            r'^(version\s*=\s*)["\'][^"\']+["\']',
-            rf'\g<1>"{new_version}"',
-            section,
-            count=1,
-            flags=re.MULTILINE,
-        )
-
-    # Match the entire [project] section up to the next section or EOF
-    pep621_pattern = r"^\[project\].*?(?=^\[|\Z)"
-    new_content, count = re.subn(
-        pep621_pattern,
-        replace_pep621,
-        content,
-        count=1,
-        flags=re.MULTILINE | re.DOTALL,
-    )
-
-    if count > 0 and new_content != content:
-        content = new_content
-        updated = True
-
-    # If not updated, try Poetry format
-    if not updated:
-
-        def replace_poetry(match: re.Match[str]) -> str:
-            section = match.group(0)
-            return re.sub(
-                r'^(version\s*=\s*)["\'][^"\']+["\']',
-                rf'\g<1>"{new_version}"',
-                section,
-                count=1,
-                flags=re.MULTILINE,
-            )
-
-        poetry_pattern = r"^\[tool\.poetry\].*?(?=^\[|\Z)"
-        new_content, count = re.subn(
-            poetry_pattern,
-            replace_poetry,
-            content,
-            count=1,
-            flags=re.MULTILINE | re.DOTALL,
-        )
-
-        if count > 0 and new_content != content:
-            content = new_content
+    spans = _find_sections(content, _VERSION_SECTIONS)
+    for header in _VERSION_SECTIONS:
+        span = spans.get(header)
+        if span is None:
+            continue
+
+        # Replace version = "..." within the section only
+        start, end = span
+        section = content[start:end]
+        new_section = _VERSION_IN_SECTION.sub(rf'\g<1>"{new_version}"', section, count=1)
+        if new_section != section:
+            content = content[:start] + new_section + content[end:]
             updated = True
+            break
 
     if not updated:
         # Check if the version is already the target version (no-op case)
@@ -187,10 +162,36 @@ def update_pyproject_version(path: Path | None, new_version: str) -> Path:
         # This is actually fine - version was already set to new_version
         return pyproject_path
 
-    pyproject_path.write_text(content)
+    _atomic_write(pyproject_path, content.encode())
     return pyproject_path
 
 
+def _find_sections(content: str, headers: Sequence[str]) -> dict[str, tuple[int, int]]:
+    """Locate TOML sections by their header lines in a single pass.
+
+    Args:
+        content: TOML document
+        headers: Section headers to look for, e.g. "[project]"
+
+    Returns:
+        Mapping of each header found to the (start, end) offsets spanning
+        its first occurrence up to the next line that starts with "[" (or EOF).
+    """
+    boundaries = [0] if content.startswith("[") else []
+    pos = content.find("\n[")
+    while pos != -1:
+        boundaries.append(pos + 1)
+        pos = content.find("\n[", pos + 1)
+    boundaries.append(len(content))
+
+    spans: dict[str, tuple[int, int]] = {}
+    for start, end in itertools.pairwise(boundaries):
+        for header in headers:
+            if header not in spans and content.startswith(header, start):
+                spans[header] = (start, end)
+    return spans
+
+
 def get_version_from_file(
     file_path: Path,
     pattern: str | None = None,
@@ -212,21 +213,16 @@ def get_version_from_file(
     if not file_path.is_file():
         raise ProjectError(f"Version file not found: {file_path}")
 
-    content = file_path.read_text()
+    content = file_path.read_text(encoding="utf-8")
 
     if pattern is None:
-        # Match __version__ = "..." or __version__ = '...'
-        # Also match VERSION = "..." for common patterns
-        patterns = [
-            r'^__version__\s*=\s*["\']([^"\']+)["\']',
-            r'^VERSION\s*=\s*["\']([^"\']+)["\']',
-            r'^version\s*=\s*["\']([^"\']+)["\']',
-        ]
+        # Match __version__ = "...", VERSION = "..." or version = "..."
+        regexes: tuple[re.Pattern[str], ...] = _VERSION_REGEXES
     else:
-        patterns = [pattern]
+        regexes = (re.compile(pattern, re.MULTILINE),)
 
-    for pat in patterns:
-        match = re.search(pat, content, re.MULTILINE)
+    for regex in regexes:
+        match = regex.search(content)
         if match:
             return match.group(1)
 
@@ -253,24 +249,17 @@ def update_version_file(
     if not file_path.is_file():
         raise ProjectError(f"Version file not found: {file_path}")
 
-    content = file_path.read_text()
+    content = file_path.read_bytes().decode()
 
-    if pattern is None:
-        # Match __version__ = "..." or __version__ = '...'
-        pattern = r'^(__version__\s*=\s*)["\'][^"\']+["\']'
-
-    new_content, count = re.subn(
-        pattern,
-        rf'\g<1>"{new_version}"',
-        content,
-        count=1,
-        flags=re.MULTILINE,
-    )
+    # Match __version__ = "..." or __version__ = '...' by default
+    regex = _DUNDER_VERSION if pattern is None else re.compile(pattern, re.MULTILINE)
+
+    new_content, count = regex.subn(rf'\g<1>"{new_version}"', content, count=1)
 
     if count == 0:
         raise VersionNotFoundError(f"Could not find version pattern in {file_path}")
 
-    file_path.write_text(new_content)
+    _atomic_write(file_path, new_content.encode())
 
 
 def _file_contains_version(file_path: Path) -> bool:
@@ -283,8 +272,8 @@ def _file_contains_version(file_path: Path) -> bool:
         True if file contains a recognizable version pattern
     """
     try:
-        content = file_path.read_text()
-        return any(re.search(pat, content, re.MULTILINE) for pat in VERSION_PATTERNS)
+        content = file_path.read_text(encoding="utf-8")
+        return any(regex.search(content) for regex in _VERSION_REGEXES)
     except OSError:
         return False
 
@@ -308,10 +297,8 @@ def detect_version_files(project_path: Path) -> list[Path]:
         /path/to/project/src/mypackage/__init__.py
         /path/to/project/src/mypackage/__version__.py
     """
-    from pathlib import Path as PathClass
-
     found: list[Path] = []
-    project_path = PathClass(project_path)
+    project_path = Path(project_path)
 
     # Directories to search for version files
     search_dirs: list[Path] = []
@@ -367,4 +354,78 @@ def update_version_in_plain_file(file_path: Path, new_version: str) -> None:
         raise ProjectError(f"Version file not found: {file_path}")
 
     # Plain VERSION files just contain the version string
-    file_path.write_text(f"{new_version}\n")
+    _atomic_write(file_path, f"{new_version}\n".encode())
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Replace the contents of a file atomically.
+
+    The data is written and fsynced to a temporary file in the same
+    directory, which then replaces the original, so an interrupted update
+    never leaves a truncated version file behind.
+
+    Symlinks are resolved first so the link itself survives and its target
+    is replaced. A file with other hard links, or whose owner cannot be
+    carried over to the replacement, is written in place instead, since
+    renaming over it would detach its other names or change its owner.
+
+    Args:
+        path: File to overwrite (its permissions and owner are preserved)
+        data: New file contents
+    """
+    path = path.resolve()
+    stat = path.stat()
+    if stat.st_nlink > 1:
+        _write_in_place(path, data, stat)
+        return
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        shutil.copymode(path, tmp_name)
+        if _copy_owner(stat, tmp_name):
+            os.replace(tmp_name, path)  # noqa: PTH105
+            return
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)  # noqa: PTH108
+        raise
+
+    os.unlink(tmp_name)  # noqa: PTH108
+    _write_in_place(path, data, stat)
+
+
+def _write_in_place(path: Path, data: bytes, stat: os.stat_result) -> None:
+    """Overwrite a file in place, leaving it with a strictly newer mtime.
+
+    The inode stays the same, so the mtime is what tells stat-keyed caches
+    (see releasio.config.loader) that the file changed, even when a
+    same-size update lands within one timestamp tick.
+    """
+    path.write_bytes(data)
+    new_stat = path.stat()
+    if new_stat.st_mtime_ns <= stat.st_mtime_ns:
+        os.utime(path, ns=(new_stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+
+def _copy_owner(stat: os.stat_result, tmp_name: str) -> bool:
+    """Give the temporary file the original file's owner and group.
+
+    Returns:
+        False if the ownership differs and may not be changed (e.g. a
+        non-root user updating someone else's group-writable file)
+    """
+    if not hasattr(os, "chown"):
+        return True
+
+    tmp_stat = os.stat(tmp_name)  # noqa: PTH116
+    if (tmp_stat.st_uid, tmp_stat.st_gid) == (stat.st_uid, stat.st_gid):
+        return True
+    try:
+        os.chown(tmp_name, stat.st_uid, stat.st_gid)
+    except PermissionError:
+        return False
+    return True
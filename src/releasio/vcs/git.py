@@ -83,6 +83,11 @@ class GitRepository:
     All operations are performed via subprocess calls to the git CLI.
     The repository must be initialized and have at least one commit.
 
+    Tag and commit-history lookups are cached for the lifetime of the
+    instance, since repository state does not change during a single
+    command. Methods that create commits or tags, or move HEAD, clear
+    the caches.
+
     Args:
         path: Path to the repository root. Defaults to current directory.
 
@@ -97,8 +102,15 @@ class GitRepository:
 
     def __init__(self, path: Path | None = None) -> None:
         self.path = (path or Path.cwd()).resolve()
+        self._latest_tag_cache: dict[str, str | None] = {}
+        self._commits_since_cache: dict[tuple[str | None, tuple[str, ...]], tuple[Commit, ...]] = {}
         self._validate_repository()
 
+    def _invalidate_caches(self) -> None:
+        """Drop cached tag and history lookups after a repository write."""
+        self._latest_tag_cache.clear()
+        self._commits_since_cache.clear()
+
     def _validate_repository(self) -> None:
         """Verify this is a valid git repository.
 
@@ -152,7 +164,8 @@ class GitRepository:
         Returns:
             True if there are uncommitted changes.
         """
-        result = self._run(["status", "--porcelain"])
+        # Only emptiness matters here, so skip rename detection
+        result = self._run(["status", "--porcelain", "--no-renames"])
         return bool(result.stdout.strip())
 
     def ensure_clean(self) -> None:
@@ -253,21 +266,48 @@ class GitRepository:
     # Commit Operations
     # =========================================================================
 
-    def get_commits_since_tag(self, tag: str | None = None) -> list[Commit]:
+    def get_commits_since_tag(
+        self,
+        tag: str | None = None,
+        *,
+        skip_patterns: Sequence[str] | None = None,
+    ) -> list[Commit]:
         """Get all commits since the given tag.
 
         Args:
             tag: Tag to get commits since. If None, returns all commits.
+            skip_patterns: Literal markers (case-insensitive) whose commits
+                are excluded by git itself, e.g. "[skip release]".
 
         Returns:
             List of commits, newest first.
         """
+        key = (tag, tuple(skip_patterns or ()))
+        cached = self._commits_since_cache.get(key)
+        if cached is None:
+            cached = tuple(self._read_commits_since_tag(tag, key[1]))
+            self._commits_since_cache[key] = cached
+        return list(cached)
+
+    def _read_commits_since_tag(
+        self,
+        tag: str | None,
+        skip_patterns: Sequence[str],
+    ) -> list[Commit]:
+        """Run git log and parse the commits since the given tag."""
         # Format: SHA, message, author name, author email, date
         fmt = _FIELD_SEP.join(["%H", "%B", "%an", "%ae", "%aI"]) + _RECORD_SEP
 
         range_spec = f"{tag}..HEAD" if tag else "HEAD"
 
-        result = self._run(["log", f"--format={fmt}", range_spec])
+        args = ["log", f"--format={fmt}"]
+        if skip_patterns:
+            # Multiple --grep patterns are OR-ed; --invert-grep drops any match
+            args.extend(["--invert-grep", "--fixed-strings", "--regexp-ignore-case"])
+            args.extend(f"--grep={pattern}" for pattern in skip_patterns)
+        args.append(range_spec)
+
+        result = self._run(args)
         output = result.stdout.strip()
 
         if not output:
@@ -320,12 +360,17 @@ class GitRepository:
         Returns:
             The latest tag name, or None if no tags match.
         """
+        if pattern in self._latest_tag_cache:
+            return self._latest_tag_cache[pattern]
+
         result = self._run(
             ["tag", "--list", pattern, "--sort=-v:refname"],
             check=False,
         )
         tags = result.stdout.strip().split("\n")
-        return tags[0] if tags and tags[0] else None
+        latest = tags[0] if tags and tags[0] else None
+        self._latest_tag_cache[pattern] = latest
+        return latest
 
     def get_all_tags(self, pattern: str = "v*") -> list[str]:
         """Get all tags matching the pattern.
@@ -386,6 +431,7 @@ class GitRepository:
         args.append(tag)
 
         self._run(args)
+        self._invalidate_caches()
 
     def push_tag(self, tag: str, remote: str = "origin") -> None:
         """Push a tag to remote.
@@ -427,6 +473,7 @@ class GitRepository:
             args.append("-B")
         args.append(ref)
         self._run(args)
+        self._invalidate_caches()
 
     def commit(
         self,
@@ -455,6 +502,7 @@ class GitRepository:
             args.append("--allow-empty")
 
         self._run(args)
+        self._invalidate_caches()
 
         # Get the commit SHA
         result = self._run(["rev-parse", "HEAD"])
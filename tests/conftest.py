@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import subprocess
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -20,10 +21,10 @@ if TYPE_CHECKING:
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_commits() -> list[Commit]:
-    """Create sample commits for testing."""
-    now = datetime.now()
+    """Create sample commits for testing (shared, do not mutate)."""
+    now = datetime(2024, 1, 1, tzinfo=UTC)
     return [
         Commit(
             sha="abc1234567890",
@@ -107,9 +108,13 @@ def breaking_commit() -> Commit:
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_config() -> ReleasePyConfig:
-    """Default releasio configuration."""
+    """Default releasio configuration, shared across the session.
+
+    Only use it in tests that read the config; build a local
+    ReleasePyConfig for tests that need to modify it.
+    """
     return ReleasePyConfig()
 
 
@@ -119,6 +124,22 @@ def default_commits_config() -> CommitsConfig:
     return CommitsConfig()
 
 
+# =============================================================================
+# Subprocess Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def mock_subprocess_run(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace subprocess.run with a MagicMock for the duration of a test.
+
+    Configure ``return_value`` or ``side_effect`` on the returned mock.
+    """
+    mock = MagicMock()
+    monkeypatch.setattr(subprocess, "run", mock)
+    return mock
+
+
 # =============================================================================
 # Temporary Git Repository Fixtures
 # =============================================================================
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import json
 import re
+import subprocess
+import tempfile
 from pathlib import Path
 
 from typer.testing import CliRunner
@@ -11,11 +14,12 @@ from releasio.cli.app import app
 
 runner = CliRunner()
 
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
 
 def strip_ansi(text: str) -> str:
     """Strip ANSI escape codes from text."""
-    ansi_pattern = re.compile(r"\x1b\[[0-9;]*m")
-    return ansi_pattern.sub("", text)
+    return _ANSI_RE.sub("", text)
 
 
 class TestCLIVersion:
@@ -102,8 +106,6 @@ class TestCLICheck:
 
     def test_check_first_release_detection(self, temp_git_repo: Path):
         """check detects first release (no tags)."""
-        import subprocess
-
         # Create pyproject.toml
         pyproject = temp_git_repo / "pyproject.toml"
         pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"\n')
@@ -126,8 +128,6 @@ class TestCLICheck:
 
     def test_check_all_bump_types(self, temp_git_repo: Path):
         """check shows different bump types (MAJOR, MINOR, PATCH)."""
-        import subprocess
-
         # Create pyproject.toml with initial version
         pyproject = temp_git_repo / "pyproject.toml"
         pyproject.write_text('[project]\nname = "test"\nversion = "1.0.0"\n')
@@ -243,9 +243,6 @@ class TestCLICheckPr:
 
     def test_check_pr_various_github_ref_formats(self, monkeypatch):
         """check-pr parses various GITHUB_REF formats."""
-        import json
-        import tempfile
-
         # Create a valid GitHub event file
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
             event = {"pull_request": {"title": "feat: from event", "number": 123}}
@@ -402,8 +399,6 @@ class TestSquashMergeDetection:
 
     def test_detect_squash_from_pr_numbers(self, temp_git_repo: Path):
         """Detects squash merge workflow from PR number patterns."""
-        import subprocess
-
         # Create commits with PR number pattern (squash merge style)
         for i in range(5):
             (temp_git_repo / f"file{i}.txt").write_text(f"content {i}")
@@ -421,8 +416,6 @@ class TestSquashMergeDetection:
 
     def test_no_squash_without_pr_numbers(self, temp_git_repo: Path):
         """Does not detect squash merge without PR number patterns."""
-        import subprocess
-
         # Create commits without PR numbers
         for i in range(5):
             (temp_git_repo / f"file{i}.txt").write_text(f"content {i}")
@@ -749,6 +749,73 @@ version_files = ["custom_version.txt"]
             assert "custom_version.txt" in result.stdout
             assert "auto-detected" in result.stdout
 
+    def test_multiple_explicit_version_files(self, git_repo_base: Path):
+        """All explicit version files are updated and reported in config order."""
+        repo = git_repo_base
+
+        (repo / "pyproject.toml").write_text("""\
+[project]
+name = "explicit"
+version = "1.0.0"
+
+[tool.releasio.version]
+update_lock_file = false
+version_files = ["a/_version.py", "b/_version.py", "VERSION"]
+""")
+        for pkg in ("a", "b"):
+            (repo / pkg).mkdir()
+            (repo / pkg / "_version.py").write_text('__version__ = "1.0.0"\n')
+        (repo / "VERSION").write_text("1.0.0\n")
+
+        subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "fix: initial"],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+        )
+
+        with patch("releasio.core.changelog.generate_changelog") as mock_changelog:
+            mock_changelog.return_value = "## [0.1.0]"
+
+            result = runner.invoke(app, ["update", str(repo), "--execute"])
+
+        assert result.exit_code == 0, result.stdout
+        for pkg in ("a", "b"):
+            assert '__version__ = "0.1.0"' in (repo / pkg / "_version.py").read_text()
+        assert (repo / "VERSION").read_text() == "0.1.0\n"
+        assert (
+            result.stdout.index("a/_version.py")
+            < result.stdout.index("b/_version.py")
+            < result.stdout.index("Updated version in VERSION")
+        )
+
+    def test_missing_explicit_version_file_fails(self, git_repo_base: Path):
+        """A missing explicit version file aborts the update."""
+        repo = git_repo_base
+
+        (repo / "pyproject.toml").write_text("""\
+[project]
+name = "explicit"
+version = "1.0.0"
+
+[tool.releasio.version]
+update_lock_file = false
+version_files = ["missing.py"]
+""")
+        subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "fix: initial"],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+        )
+
+        result = runner.invoke(app, ["update", str(repo), "--execute"])
+
+        assert result.exit_code == 1
+        assert "Error updating missing.py" in result.output
+
 
 class TestVersionPatternVariations:
     """Tests for various version string patterns."""
@@ -46,6 +46,16 @@ class TestGitRepository:
 
         assert repo.is_dirty()
 
+    def test_is_dirty_reflects_working_tree_changes(self, temp_git_repo: Path):
+        """is_dirty() is not cached: it sees changes made after a clean check."""
+        repo = GitRepository(temp_git_repo)
+        assert not repo.is_dirty()
+
+        (temp_git_repo / "README.md").rename(temp_git_repo / "RENAMED.md")
+        subprocess.run(["git", "add", "-A"], cwd=temp_git_repo, check=True, capture_output=True)
+
+        assert repo.is_dirty()
+
     def test_ensure_clean_raises_when_dirty(self, temp_git_repo: Path):
         """ensure_clean() raises when repository is dirty."""
         repo = GitRepository(temp_git_repo)
@@ -127,6 +137,48 @@ class TestGitCommits:
         assert latest.body is not None
         assert "body" in latest.body
 
+    def test_get_commits_since_tag_is_cached(self, temp_git_repo_with_commits: Path):
+        """Repeated lookups reuse the first git log result until a write."""
+        repo = GitRepository(temp_git_repo_with_commits)
+        first = repo.get_commits_since_tag(None)
+
+        # Commit behind the repository object's back: the cache is not refreshed
+        (temp_git_repo_with_commits / "external.txt").write_text("content")
+        subprocess.run(
+            ["git", "add", "."],
+            cwd=temp_git_repo_with_commits,
+            check=True,
+            capture_output=True,
+        )
+        subprocess.run(
+            ["git", "commit", "-m", "fix: external"],
+            cwd=temp_git_repo_with_commits,
+            check=True,
+            capture_output=True,
+        )
+        assert repo.get_commits_since_tag(None) == first
+
+        # Writing through the repository object invalidates the cache
+        repo.commit("chore: empty", allow_empty=True)
+        commits = repo.get_commits_since_tag(None)
+        assert len(commits) == len(first) + 2
+        assert commits[0].subject == "chore: empty"
+
+    def test_get_commits_since_tag_skip_patterns(self, temp_git_repo_with_commits: Path):
+        """Commits containing a skip marker are excluded, case-insensitively."""
+        repo = GitRepository(temp_git_repo_with_commits)
+        repo.commit("fix: hidden\n\nDetails [Skip Release]", allow_empty=True)
+        repo.commit("fix: also hidden [no release]", allow_empty=True)
+        repo.commit("fix: visible", allow_empty=True)
+
+        commits = repo.get_commits_since_tag(None, skip_patterns=["[skip release]", "[no release]"])
+
+        subjects = [c.subject for c in commits]
+        assert "fix: visible" in subjects
+        assert "fix: hidden" not in subjects
+        assert "fix: also hidden [no release]" not in subjects
+        assert len(repo.get_commits_since_tag(None)) == len(commits) + 2
+
     def test_get_commits_empty_repo_raises(self, tmp_path: Path):
         """Get commits from repository with no commits raises GitError."""
         # Create a git repo with no commits (no HEAD yet)
@@ -167,6 +219,15 @@ class TestGitTags:
         assert repo.tag_exists("v1.0.0")
         assert repo.get_latest_tag() == "v1.0.0"
 
+    def test_get_latest_tag_refreshed_after_create(self, temp_git_repo: Path):
+        """Creating a tag invalidates the cached latest tag."""
+        repo = GitRepository(temp_git_repo)
+        assert repo.get_latest_tag() is None
+
+        repo.create_tag("v1.0.0")
+
+        assert repo.get_latest_tag() == "v1.0.0"
+
     def test_get_all_tags(self, temp_git_repo: Path):
         """Get all tags matching pattern."""
         repo = GitRepository(temp_git_repo)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import re
 from typing import TYPE_CHECKING
 
 import pytest
@@ -17,6 +19,8 @@ from releasio.project.pyproject import (
 if TYPE_CHECKING:
     from pathlib import Path
 
+_VERSION_LINE_RE = re.compile(r'^version = "([^"]+)"$', re.MULTILINE)
+
 
 class TestDetectProject:
     """Integration tests for project detection."""
@@ -113,6 +117,62 @@ build-backend = "hatchling.build"
         assert 'version = "2.0.0"' in content
         assert "[build-system]" in content
 
+    def test_update_round_trips_non_ascii_and_crlf(self, tmp_path: Path):
+        """Only the version bytes change in a UTF-8, CRLF pyproject.toml."""
+        pyproject = tmp_path / "pyproject.toml"
+        original = (
+            '[project]\r\nname = "test"\r\nversion = "1.0.0"\r\n'
+            'authors = [{name = "Mikko Leppänen"}]\r\ndescription = "✨ release"\r\n'
+        ).encode()
+        pyproject.write_bytes(original)
+
+        update_pyproject_version(tmp_path, "2.0.0")
+
+        assert pyproject.read_bytes() == original.replace(b'"1.0.0"', b'"2.0.0"')
+
+    def test_update_only_touches_version_section(self, tmp_path: Path):
+        """Only the version key of the [project] section is replaced."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text(
+            """\
+[tool.other]
+version = "9.9.9"
+
+[project]
+name = "test"
+version = "1.0.0"
+
+[project.optional-dependencies]
+version = "0.0.1"
+"""
+        )
+
+        update_pyproject_version(tmp_path, "2.0.0")
+
+        content = pyproject.read_text()
+        assert _VERSION_LINE_RE.findall(content) == ["9.9.9", "2.0.0", "0.0.1"]
+
+    def test_update_falls_back_to_poetry_section(self, tmp_path: Path):
+        """[tool.poetry] is updated when [project] has no version key."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text(
+            """\
+[tool.poetry]
+name = "test"
+version = "1.0.0"
+
+[project]
+name = "test"
+dynamic = ["version"]
+"""
+        )
+
+        update_pyproject_version(tmp_path, "2.0.0")
+
+        content = pyproject.read_text()
+        assert content.startswith('[tool.poetry]\nname = "test"\nversion = "2.0.0"\n')
+        assert 'dynamic = ["version"]' in content
+
     def test_get_version_not_found_raises(self, tmp_path: Path):
         """Raises VersionNotFoundError when version not found."""
         pyproject = tmp_path / "pyproject.toml"
@@ -121,6 +181,25 @@ build-backend = "hatchling.build"
         with pytest.raises(VersionNotFoundError):
             get_pyproject_version(tmp_path)
 
+    def test_get_version_ignores_other_sections(self, tmp_path: Path):
+        """Only [project] or [tool.poetry] version keys are read."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text(
+            """\
+[project]
+name = "test"
+dynamic = ["version"]
+
+[tool.poetry]
+version = "2.0.0"
+
+[tool.other]
+version = "9.9.9"
+"""
+        )
+
+        assert get_pyproject_version(tmp_path) == "2.0.0"
+
     def test_update_same_version_no_op(self, tmp_path: Path):
         """Update to same version succeeds (no-op case for first release)."""
         pyproject = tmp_path / "pyproject.toml"
@@ -168,6 +247,68 @@ class TestVersionFile:
         content = version_file.read_text()
         assert '__version__ = "2.0.0"' in content
 
+    def test_update_version_file_is_atomic(self, tmp_path: Path):
+        """Update replaces the file in one step and keeps its permissions."""
+        version_file = tmp_path / "__init__.py"
+        version_file.write_text('__version__ = "1.0.0"\n')
+        version_file.chmod(0o640)
+
+        update_version_file(version_file, "2.0.0")
+
+        assert version_file.read_text() == '__version__ = "2.0.0"\n'
+        assert version_file.stat().st_mode & 0o777 == 0o640
+        assert list(tmp_path.iterdir()) == [version_file]
+
+    def test_update_version_file_round_trips_non_ascii_and_crlf(self, tmp_path: Path):
+        """Only the version bytes change in a UTF-8, CRLF version file."""
+        version_file = tmp_path / "__init__.py"
+        original = '"""Pakkaus ñ."""\r\n__version__ = "1.0.0"\r\n'.encode()
+        version_file.write_bytes(original)
+
+        update_version_file(version_file, "2.0.0")
+
+        assert version_file.read_bytes() == original.replace(b'"1.0.0"', b'"2.0.0"')
+
+    @pytest.mark.skipif(
+        not hasattr(os, "geteuid") or os.geteuid() != 0,
+        reason="changing file ownership requires root",
+    )
+    def test_update_version_file_keeps_owner(self, tmp_path: Path):
+        """A root-run update keeps the file's original owner and group."""
+        version_file = tmp_path / "__init__.py"
+        version_file.write_text('__version__ = "1.0.0"\n')
+        os.chown(version_file, 12345, 12345)
+
+        update_version_file(version_file, "2.0.0")
+
+        stat = version_file.stat()
+        assert (stat.st_uid, stat.st_gid) == (12345, 12345)
+        assert version_file.read_text() == '__version__ = "2.0.0"\n'
+
+    def test_update_version_file_keeps_symlink(self, tmp_path: Path):
+        """Updating through a symlink rewrites the target and keeps the link."""
+        shared = tmp_path / "shared_version.py"
+        shared.write_text('__version__ = "1.0.0"\n')
+        version_file = tmp_path / "__init__.py"
+        version_file.symlink_to(shared.name)
+
+        update_version_file(version_file, "2.0.0")
+
+        assert version_file.is_symlink()
+        assert shared.read_text() == '__version__ = "2.0.0"\n'
+
+    def test_update_version_file_keeps_hard_link(self, tmp_path: Path):
+        """Updating a hard-linked file is visible through every link."""
+        shared = tmp_path / "shared_version.py"
+        shared.write_text('__version__ = "1.0.0"\n')
+        version_file = tmp_path / "__init__.py"
+        version_file.hardlink_to(shared)
+
+        update_version_file(version_file, "2.0.0")
+
+        assert version_file.samefile(shared)
+        assert shared.read_text() == '__version__ = "2.0.0"\n'
+
     def test_update_version_file_preserves_other_content(self, tmp_path: Path):
         """Updating version preserves other file content."""
         version_file = tmp_path / "__init__.py"
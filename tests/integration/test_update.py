@@ -106,6 +106,22 @@ class TestUpdateDryRun:
 
         assert "No commits found" in result.stdout or result.exit_code == 0
 
+    def test_update_all_commits_skipped(self, temp_git_repo_with_pyproject: Path):
+        """Commits with skip release markers are not released."""
+        repo = temp_git_repo_with_pyproject
+        subprocess.run(["git", "tag", "v1.0.0"], cwd=repo, check=True, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "--allow-empty", "-m", "feat: wip [skip release]"],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+        )
+
+        result = runner.invoke(app, ["update", str(repo)])
+
+        assert result.exit_code == 0
+        assert "All commits have skip release markers" in result.stdout
+
     def test_update_dry_run_version_bump(self, repo_with_feat_commit: Path):
         """Dry run shows correct version bump."""
         result = runner.invoke(app, ["update", str(repo_with_feat_commit)])
@@ -278,6 +294,71 @@ class TestUpdateAppendChangelog:
             assert "Initial release" in content
 
 
+@pytest.fixture
+def repo_scope_filtered(temp_git_repo_with_pyproject: Path) -> Path:
+    """Create repo whose only commit since the last tag is excluded by scope_regex."""
+    repo = temp_git_repo_with_pyproject
+
+    pyproject = repo / "pyproject.toml"
+    pyproject.write_text(
+        pyproject.read_text() + '\n[tool.releasio.commits]\nscope_regex = "^api$"\n'
+    )
+    (repo / "CHANGELOG.md").write_text("# Changelog\n\n## [1.0.0]\n")
+    subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", "chore: configure scope filter"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+    subprocess.run(["git", "tag", "v1.0.0"], cwd=repo, check=True, capture_output=True)
+
+    (repo / "core.py").write_text("# Core change\n")
+    subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", "feat(core): internal change"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+    return repo
+
+
+class TestUpdateScopeFilteredChangelog:
+    """Tests for forced releases whose commits are all filtered out by scope."""
+
+    def test_forced_version_still_writes_git_cliff_section(self, repo_scope_filtered: Path):
+        """git-cliff still renders the version section for a forced release."""
+        with (
+            patch("releasio.core.changelog.is_git_cliff_available", return_value=True),
+            patch(
+                "releasio.core.changelog._run_git_cliff", return_value="## [2.0.0]\n"
+            ) as mock_cliff,
+        ):
+            result = runner.invoke(
+                app,
+                ["update", str(repo_scope_filtered), "--execute", "--version", "2.0.0"],
+            )
+
+        assert result.exit_code == 0
+        mock_cliff.assert_called_once()
+        changelog = repo_scope_filtered / "CHANGELOG.md"
+        assert changelog.read_text() == "## [2.0.0]\n\n# Changelog\n\n## [1.0.0]\n"
+
+    def test_forced_version_without_content_leaves_changelog(self, repo_scope_filtered: Path):
+        """An empty native changelog does not prepend a blank line."""
+        with patch("releasio.core.changelog.is_git_cliff_available", return_value=False):
+            result = runner.invoke(
+                app,
+                ["update", str(repo_scope_filtered), "--execute", "--version", "2.0.0"],
+            )
+
+        assert result.exit_code == 0
+        changelog = repo_scope_filtered / "CHANGELOG.md"
+        assert changelog.read_text() == "# Changelog\n\n## [1.0.0]\n"
+
+
 # =============================================================================
 # First Release Detection Tests
 # =============================================================================
@@ -485,3 +566,67 @@ enabled = false
             # CHANGELOG.md should be created
             changelog = repo_with_feat_commit / "CHANGELOG.md"
             assert changelog.exists()
+
+
+class TestUpdateHooks:
+    """Tests for pre_bump/post_bump hooks in the update command."""
+
+    def test_parallel_hooks_report_output_in_order(self, repo_with_feat_commit: Path):
+        """Parallel hooks all run and their output keeps the configured order."""
+        config_file = repo_with_feat_commit / ".releasio.toml"
+        config_file.write_text(
+            """
+allow_dirty = true
+[changelog]
+enabled = false
+[hooks]
+parallel = true
+pre_bump = ["sleep 0.2 && echo first-{version}", "echo second-{prev_version}"]
+"""
+        )
+
+        result = runner.invoke(app, ["update", str(repo_with_feat_commit), "--execute"])
+
+        assert result.exit_code == 0
+        hook_output = [
+            line.strip()
+            for line in result.stdout.splitlines()
+            if line.strip() in ("first-1.1.0", "second-1.0.0")
+        ]
+        assert hook_output == ["first-1.1.0", "second-1.0.0"]
+
+    def test_parallel_hook_failure_aborts(self, repo_with_feat_commit: Path):
+        """A failing parallel hook aborts before the version is bumped."""
+        config_file = repo_with_feat_commit / ".releasio.toml"
+        config_file.write_text(
+            """
+allow_dirty = true
+[hooks]
+parallel = true
+pre_bump = ["true", "exit 3"]
+"""
+        )
+
+        result = runner.invoke(app, ["update", str(repo_with_feat_commit), "--execute"])
+
+        assert result.exit_code == 1
+        content = (repo_with_feat_commit / "pyproject.toml").read_text()
+        assert 'version = "1.0.0"' in content
+
+    def test_hook_shell_braces_are_preserved(self, repo_with_feat_commit: Path):
+        """Only known template variables are substituted; shell braces pass through."""
+        config_file = repo_with_feat_commit / ".releasio.toml"
+        config_file.write_text(
+            """
+allow_dirty = true
+[changelog]
+enabled = false
+[hooks]
+post_bump = ["NAME=hook; echo ${NAME}-{bump_type}-{version}"]
+"""
+        )
+
+        result = runner.invoke(app, ["update", str(repo_with_feat_commit), "--execute"])
+
+        assert result.exit_code == 0
+        assert "hook-minor-1.1.0" in result.stdout
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import re
 import subprocess
+from collections import namedtuple
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
-from unittest.mock import MagicMock, patch
+from typing import TYPE_CHECKING, cast
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -17,168 +19,212 @@ from releasio.core.changelog import (
     generate_native_changelog,
     get_bump_from_git_cliff,
     is_git_cliff_available,
+    prepend_changelog,
 )
 from releasio.core.commits import ParsedCommit
 from releasio.core.version import BumpType, Version
 from releasio.exceptions import ChangelogError, GitCliffError
-from releasio.vcs.git import Commit, GitRepository
+from releasio.vcs.git import Commit
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from pytest_mock import MockerFixture
 
-@pytest.fixture
-def mock_repo(tmp_path: Path) -> MagicMock:
-    """Create a mock GitRepository."""
-    repo = MagicMock(spec=GitRepository)
-    repo.path = tmp_path
-    return repo
+    from releasio.vcs.git import GitRepository
 
+_RE_NOT_FOUND = re.compile(r"git-cliff not found")
 
-class TestGenerateChangelog:
-    """Tests for generate_changelog with git-cliff."""
+# Lightweight stand-in for subprocess.CompletedProcess
+_Completed = namedtuple("_Completed", ["stdout", "stderr", "returncode"], defaults=("", "", 0))
 
-    def test_generate_changelog_success(self, mock_repo: MagicMock, tmp_path: Path):
-        """Generate changelog via git-cliff."""
-        version = Version(1, 0, 0)
-        config = ReleasePyConfig()
+# Wall-clock time seen by the changelog module during tests
+_FIXED_NOW = datetime(2024, 6, 15, 12, 0, 0, tzinfo=UTC)
 
-        # Create pyproject.toml
-        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
 
-        with (
-            patch("releasio.core.changelog.is_git_cliff_available", return_value=True),
-            patch("subprocess.run") as mock_run,
-        ):
-            mock_run.return_value = MagicMock(
-                stdout="## [1.0.0] - 2024-01-01\n\n### Features\n\n- New feature",
-                returncode=0,
-            )
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns _FIXED_NOW."""
 
-            result = generate_changelog(
-                repo=mock_repo,
-                version=version,
-                config=config,
-            )
+    @classmethod
+    def now(cls, tz=None):
+        return _FIXED_NOW.astimezone(tz) if tz is not None else _FIXED_NOW.replace(tzinfo=None)
 
-            assert "1.0.0" in result
-            assert "Features" in result
-            mock_run.assert_called_once()
 
-    def test_generate_changelog_git_cliff_not_found_fallback_disabled(self, mock_repo: MagicMock):
-        """Raise ChangelogError when git-cliff not found and native_fallback disabled."""
-        version = Version(1, 0, 0)
-        # Disable native fallback to force the error
-        config = ReleasePyConfig(changelog=ChangelogConfig(native_fallback=False))
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pin datetime.now() in the changelog module to _FIXED_NOW."""
+    monkeypatch.setattr("releasio.core.changelog.datetime", _FrozenDatetime)
 
-        with patch("releasio.core.changelog.is_git_cliff_available", return_value=False):
-            with pytest.raises(ChangelogError, match="git-cliff not found"):
-                generate_changelog(
-                    repo=mock_repo,
-                    version=version,
-                    config=config,
-                )
 
-    def test_generate_changelog_git_cliff_failure(self, mock_repo: MagicMock, tmp_path: Path):
-        """Raise GitCliffError when git-cliff fails."""
-        version = Version(1, 0, 0)
-        config = ReleasePyConfig()
+@pytest.fixture(scope="module")
+def version() -> Version:
+    """Version being released (immutable, shared by the module)."""
+    return Version(1, 0, 0)
 
-        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
 
-        with (
-            patch("releasio.core.changelog.is_git_cliff_available", return_value=True),
-            patch("subprocess.run") as mock_run,
-        ):
-            mock_run.side_effect = subprocess.CalledProcessError(
-                1, "git-cliff", stderr="Invalid config"
-            )
+@pytest.fixture(scope="session")
+def shared_project_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Project root with a minimal pyproject.toml (read-only, shared by the session)."""
+    path = tmp_path_factory.mktemp("project")
+    (path / "pyproject.toml").write_bytes(b"[project]\nname = 'test'\n")
+    return path
 
-            with pytest.raises(GitCliffError):
-                generate_changelog(
-                    repo=mock_repo,
-                    version=version,
-                    config=config,
-                )
 
-    def test_generate_changelog_unreleased_flag(self, mock_repo: MagicMock, tmp_path: Path):
-        """Pass --unreleased flag when unreleased_only=True."""
-        version = Version(1, 0, 0)
-        config = ReleasePyConfig()
+class _RepoStub:
+    """Minimal GitRepository stand-in exposing only what changelog code reads."""
 
-        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.get_latest_tag = MagicMock(return_value=None)
+        self.get_commits_since_tag = MagicMock(return_value=[])
 
-        with (
-            patch("releasio.core.changelog.is_git_cliff_available", return_value=True),
-            patch("subprocess.run") as mock_run,
-        ):
-            mock_run.return_value = MagicMock(stdout="changelog", returncode=0)
 
-            generate_changelog(
-                repo=mock_repo,
-                version=version,
-                config=config,
-                unreleased_only=True,
-            )
+@pytest.fixture
+def mock_repo(shared_project_dir: Path) -> GitRepository:
+    """Create a stub GitRepository rooted at the shared project directory."""
+    return cast("GitRepository", _RepoStub(shared_project_dir))
 
-            call_args = mock_run.call_args[0][0]
-            assert "--unreleased" in call_args
 
-    def test_generate_changelog_with_github_repo(self, mock_repo: MagicMock, tmp_path: Path):
-        """Pass --github-repo flag when github_repo is provided."""
-        version = Version(1, 0, 0)
-        config = ReleasePyConfig()
+class TestGenerateChangelog:
+    """Tests for generate_changelog with git-cliff."""
 
-        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
+    def test_generate_changelog_success(
+        self,
+        mock_repo: GitRepository,
+        default_config: ReleasePyConfig,
+        version: Version,
+        mock_subprocess_run: MagicMock,
+        mocker: MockerFixture,
+    ):
+        """Generate changelog via git-cliff."""
+        mocker.patch("releasio.core.changelog.is_git_cliff_available", return_value=True)
+        mock_subprocess_run.return_value = _Completed(
+            stdout=b"## [1.0.0] - 2024-01-01\n\n### Features\n\n- New feature",
+        )
 
-        with (
-            patch("releasio.core.changelog.is_git_cliff_available", return_value=True),
-            patch("subprocess.run") as mock_run,
-        ):
-            mock_run.return_value = MagicMock(stdout="changelog with PRs", returncode=0)
+        result = generate_changelog(
+            repo=mock_repo,
+            version=version,
+            config=default_config,
+        )
 
+        assert "1.0.0" in result
+        assert "Features" in result
+        mock_subprocess_run.assert_called_once()
+
+    def test_generate_changelog_git_cliff_not_found_fallback_disabled(
+        self, mock_repo: GitRepository, version: Version, mocker: MockerFixture
+    ):
+        """Raise ChangelogError when git-cliff not found and native_fallback disabled."""
+        # Disable native fallback to force the error
+        config = ReleasePyConfig(changelog=ChangelogConfig(native_fallback=False))
+
+        mocker.patch("releasio.core.changelog.is_git_cliff_available", return_value=False)
+        with pytest.raises(ChangelogError, match=_RE_NOT_FOUND):
             generate_changelog(
                 repo=mock_repo,
                 version=version,
                 config=config,
-                github_repo="owner/repo",
             )
 
-            call_args = mock_run.call_args[0][0]
-            assert "--github-repo" in call_args
-            assert "owner/repo" in call_args
-
-    def test_generate_changelog_without_github_repo(self, mock_repo: MagicMock, tmp_path: Path):
-        """Omit --github-repo flag when github_repo is None."""
-        version = Version(1, 0, 0)
-        config = ReleasePyConfig()
-
-        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
-
-        with (
-            patch("releasio.core.changelog.is_git_cliff_available", return_value=True),
-            patch("subprocess.run") as mock_run,
-        ):
-            mock_run.return_value = MagicMock(stdout="changelog", returncode=0)
+    def test_generate_changelog_git_cliff_failure(
+        self,
+        mock_repo: GitRepository,
+        default_config: ReleasePyConfig,
+        version: Version,
+        mock_subprocess_run: MagicMock,
+        mocker: MockerFixture,
+    ):
+        """Raise GitCliffError when git-cliff fails."""
+        mocker.patch("releasio.core.changelog.is_git_cliff_available", return_value=True)
+        mock_subprocess_run.return_value = _Completed(
+            stdout=b"", stderr=b"Invalid config", returncode=1
+        )
 
+        with pytest.raises(GitCliffError, match="exit code 1") as exc_info:
             generate_changelog(
                 repo=mock_repo,
                 version=version,
-                config=config,
-                github_repo=None,
+                config=default_config,
             )
 
-            call_args = mock_run.call_args[0][0]
-            assert "--github-repo" not in call_args
+        assert exc_info.value.stderr == "Invalid config"
+
+    def test_generate_changelog_unreleased_flag(
+        self,
+        mock_repo: GitRepository,
+        default_config: ReleasePyConfig,
+        version: Version,
+        mock_subprocess_run: MagicMock,
+        mocker: MockerFixture,
+    ):
+        """Pass --unreleased flag when unreleased_only=True."""
+        mocker.patch("releasio.core.changelog.is_git_cliff_available", return_value=True)
+        mock_subprocess_run.return_value = _Completed(stdout=b"changelog")
+
+        generate_changelog(
+            repo=mock_repo,
+            version=version,
+            config=default_config,
+            unreleased_only=True,
+        )
+
+        argv = set(mock_subprocess_run.call_args.args[0])
+        assert "--unreleased" in argv
+
+    def test_generate_changelog_with_github_repo(
+        self,
+        mock_repo: GitRepository,
+        default_config: ReleasePyConfig,
+        version: Version,
+        mock_subprocess_run: MagicMock,
+        mocker: MockerFixture,
+    ):
+        """Pass --github-repo flag when github_repo is provided."""
+        mocker.patch("releasio.core.changelog.is_git_cliff_available", return_value=True)
+        mock_subprocess_run.return_value = _Completed(stdout=b"changelog with PRs")
+
+        generate_changelog(
+            repo=mock_repo,
+            version=version,
+            config=default_config,
+            github_repo="owner/repo",
+        )
+
+        argv = mock_subprocess_run.call_args.args[0]
+        assert argv[argv.index("--github-repo") + 1] == "owner/repo"
+
+    def test_generate_changelog_without_github_repo(
+        self,
+        mock_repo: GitRepository,
+        default_config: ReleasePyConfig,
+        version: Version,
+        mock_subprocess_run: MagicMock,
+        mocker: MockerFixture,
+    ):
+        """Omit --github-repo flag when github_repo is None."""
+        mocker.patch("releasio.core.changelog.is_git_cliff_available", return_value=True)
+        mock_subprocess_run.return_value = _Completed(stdout=b"changelog")
+
+        generate_changelog(
+            repo=mock_repo,
+            version=version,
+            config=default_config,
+            github_repo=None,
+        )
+
+        argv = set(mock_subprocess_run.call_args.args[0])
+        assert "--github-repo" not in argv
 
     def test_generate_changelog_native_fallback_when_git_cliff_unavailable(
-        self, mock_repo: MagicMock
+        self,
+        mock_repo: GitRepository,
+        default_config: ReleasePyConfig,
+        version: Version,
+        mocker: MockerFixture,
     ):
         """Use native fallback when git-cliff is not available."""
-        version = Version(1, 0, 0)
         # native_fallback is True by default
-        config = ReleasePyConfig()
-
         # Create a mock commit for native fallback
         mock_commit = Commit(
             "abc123",
@@ -189,131 +235,262 @@ class TestGenerateChangelog:
         )
         parsed_commit = ParsedCommit.from_commit(
             mock_commit,
-            breaking_pattern=config.commits.breaking_pattern,
+            breaking_pattern=default_config.commits.breaking_pattern,
+        )
+
+        mocker.patch("releasio.core.changelog.is_git_cliff_available", return_value=False)
+        # Pass parsed_commits directly to avoid internal parse_commits call
+        result = generate_changelog(
+            repo=mock_repo,
+            version=version,
+            config=default_config,
+            parsed_commits=[parsed_commit],
+        )
+
+        # Should use native fallback and include the feature
+        assert "1.0.0" in result
+        assert "feat" in result.lower() or "feature" in result.lower()
+
+    def test_generate_changelog_empty_parsed_commits_still_runs_git_cliff(
+        self,
+        mock_repo: GitRepository,
+        default_config: ReleasePyConfig,
+        version: Version,
+        mock_subprocess_run: MagicMock,
+        mocker: MockerFixture,
+    ):
+        """git-cliff still renders the version section when every commit was filtered out."""
+        mocker.patch("releasio.core.changelog.is_git_cliff_available", return_value=True)
+        mock_subprocess_run.return_value = _Completed(stdout=b"## [1.0.0]\n")
+
+        result = generate_changelog(
+            repo=mock_repo,
+            version=version,
+            config=default_config,
+            parsed_commits=[],
+        )
+
+        assert result == "## [1.0.0]"
+        mock_subprocess_run.assert_called_once()
+
+    def test_generate_changelog_streams_git_cliff_output(
+        self,
+        mock_repo: GitRepository,
+        tmp_path: Path,
+        default_config: ReleasePyConfig,
+        mock_subprocess_run: MagicMock,
+        mocker: MockerFixture,
+    ):
+        """git-cliff output is written straight into output_path."""
+        changelog = tmp_path / "CHANGELOG.md"
+        changelog.write_text("## [1.0.0]\n\n- Initial release\n")
+
+        def fake_run(*_args, **kwargs):
+            kwargs["stdout"].write(b"## [1.1.0]\n\n- New feature")
+            return _Completed()
+
+        mock_subprocess_run.side_effect = fake_run
+        mocker.patch("releasio.core.changelog.is_git_cliff_available", return_value=True)
+        result = generate_changelog(
+            repo=mock_repo,
+            version=Version(1, 1, 0),
+            config=default_config,
+            output_path=changelog,
+        )
+
+        assert result is None
+        assert changelog.read_text() == (
+            "## [1.1.0]\n\n- New feature\n## [1.0.0]\n\n- Initial release\n"
         )
+        assert list(tmp_path.iterdir()) == [changelog]
+
+    def test_generate_changelog_stream_failure_keeps_changelog(
+        self,
+        mock_repo: GitRepository,
+        tmp_path: Path,
+        default_config: ReleasePyConfig,
+        mock_subprocess_run: MagicMock,
+        mocker: MockerFixture,
+    ):
+        """A failing git-cliff run leaves the existing changelog untouched."""
+        changelog = tmp_path / "CHANGELOG.md"
+        changelog.write_text("## [1.0.0]\n")
+
+        def fake_run(*_args, **kwargs):
+            kwargs["stdout"].write(b"partial")
+            return _Completed(stderr=b"boom", returncode=1)
 
-        with patch("releasio.core.changelog.is_git_cliff_available", return_value=False):
-            # Pass parsed_commits directly to avoid internal parse_commits call
-            result = generate_changelog(
+        mock_subprocess_run.side_effect = fake_run
+        mocker.patch("releasio.core.changelog.is_git_cliff_available", return_value=True)
+        with pytest.raises(GitCliffError):
+            generate_changelog(
                 repo=mock_repo,
-                version=version,
-                config=config,
-                parsed_commits=[parsed_commit],
+                version=Version(1, 1, 0),
+                config=default_config,
+                output_path=changelog,
             )
 
-            # Should use native fallback and include the feature
-            assert "1.0.0" in result
-            assert "feat" in result.lower() or "feature" in result.lower()
+        assert changelog.read_text() == "## [1.0.0]\n"
+        assert list(tmp_path.iterdir()) == [changelog]
+
+
+@pytest.fixture(scope="class")
+def fallback_result(
+    shared_project_dir: Path,
+    default_config: ReleasePyConfig,
+    sample_commits: list[Commit],
+    version: Version,
+) -> str:
+    """Native fallback changelog for sample_commits, generated once per class."""
+    stub = _RepoStub(shared_project_dir)
+    stub.get_commits_since_tag.return_value = sample_commits
+    repo = cast("GitRepository", stub)
+    # Class-scoped fixtures run before the function-scoped frozen_now,
+    # so the clock is pinned here as well
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("releasio.core.changelog.is_git_cliff_available", lambda: False)
+        mp.setattr("releasio.core.changelog.datetime", _FrozenDatetime)
+        return generate_changelog(repo=repo, version=version, config=default_config)
+
+
+class TestGenerateChangelogNativeFallback:
+    """Tests for the native fallback output of generate_changelog."""
+
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            "### ✨ Features",
+            "- add new authentication module",
+            "### 🐛 Bug Fixes",
+            "- **api:** handle null response from server",
+            "### ⚠️ Breaking Changes",
+            "### 📚 Documentation",
+            "## [1.0.0] - 2024-06-15",
+        ],
+    )
+    def test_fallback_sections(self, fallback_result: str, needle: str):
+        """Each commit type from sample_commits is rendered in its section."""
+        assert needle in fallback_result
+
+    def test_fallback_breaking_section_first(self, fallback_result: str):
+        """Breaking changes are listed before any other section."""
+        assert fallback_result.index("### ⚠️ Breaking Changes") < fallback_result.index(
+            "### ✨ Features"
+        )
 
-    def test_is_git_cliff_available_returns_false_when_not_installed(self):
-        """Test is_git_cliff_available returns False when git-cliff not installed."""
-        with patch("shutil.which", return_value=None):
-            assert is_git_cliff_available() is False
 
-    def test_is_git_cliff_available_returns_true_when_installed(self):
-        """Test is_git_cliff_available returns True when git-cliff is installed."""
-        with patch("shutil.which", return_value="/usr/bin/git-cliff"):
-            assert is_git_cliff_available() is True
+class TestPrependChangelog:
+    """Tests for prepend_changelog."""
 
+    def test_creates_missing_file(self, tmp_path: Path):
+        """Missing changelog is created with the new content."""
+        changelog = tmp_path / "CHANGELOG.md"
 
-class TestGetBumpFromGitCliff:
-    """Tests for get_bump_from_git_cliff."""
+        prepend_changelog(changelog, "## [1.0.0]\n\n- Initial release\n")
 
-    def test_bump_major(self, mock_repo: MagicMock, tmp_path: Path):
-        """Detect major bump from git-cliff output."""
-        config = ReleasePyConfig()
-        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
+        assert changelog.read_text() == "## [1.0.0]\n\n- Initial release\n"
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout="",
-                stderr="Bumping major version",
-                returncode=0,
-            )
+    def test_prepends_to_existing_file(self, tmp_path: Path):
+        """New content is placed above the existing changelog."""
+        changelog = tmp_path / "CHANGELOG.md"
+        changelog.write_text("## [1.0.0]\n\n- ✨ Initial release\n")
 
-            result = get_bump_from_git_cliff(mock_repo, config)
-            assert result == BumpType.MAJOR
+        prepend_changelog(changelog, "## [1.1.0]\n\n- New feature")
 
-    def test_bump_minor(self, mock_repo: MagicMock, tmp_path: Path):
-        """Detect minor bump from git-cliff output."""
-        config = ReleasePyConfig()
-        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
+        assert changelog.read_text() == (
+            "## [1.1.0]\n\n- New feature\n## [1.0.0]\n\n- ✨ Initial release\n"
+        )
+        assert list(tmp_path.iterdir()) == [changelog]
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout="Detected minor bump",
-                stderr="",
-                returncode=0,
-            )
+    def test_new_and_existing_files_are_utf8(self, tmp_path: Path):
+        """Creating and prepending both write UTF-8 bytes."""
+        changelog = tmp_path / "CHANGELOG.md"
 
-            result = get_bump_from_git_cliff(mock_repo, config)
-            assert result == BumpType.MINOR
+        prepend_changelog(changelog, "### ✨ Features\n")
+        prepend_changelog(changelog, "### 🐛 Bug Fixes\n")
 
-    def test_bump_patch(self, mock_repo: MagicMock, tmp_path: Path):
-        """Detect patch bump from git-cliff output."""
-        config = ReleasePyConfig()
-        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
+        assert changelog.read_bytes() == "### 🐛 Bug Fixes\n\n### ✨ Features\n".encode()
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout="patch version",
-                stderr="",
-                returncode=0,
-            )
+    def test_empty_content_leaves_file_untouched(self, tmp_path: Path):
+        """Empty content does not add a stray blank line to the changelog."""
+        changelog = tmp_path / "CHANGELOG.md"
+        changelog.write_text("# Changelog\n\n## 1.0.0\n")
 
-            result = get_bump_from_git_cliff(mock_repo, config)
-            assert result == BumpType.PATCH
+        prepend_changelog(changelog, "")
 
-    def test_bump_none_no_output(self, mock_repo: MagicMock, tmp_path: Path):
-        """Return NONE when no bump info in output."""
-        config = ReleasePyConfig()
-        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
+        assert changelog.read_text() == "# Changelog\n\n## 1.0.0\n"
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout="",
-                stderr="",
-                returncode=0,
-            )
 
-            result = get_bump_from_git_cliff(mock_repo, config)
-            assert result == BumpType.NONE
+class TestGetBumpFromGitCliff:
+    """Tests for get_bump_from_git_cliff."""
+
+    @pytest.mark.parametrize(
+        ("output", "expected"),
+        [
+            (("", "Bumping major version"), BumpType.MAJOR),
+            (("Detected minor bump", ""), BumpType.MINOR),
+            (("patch version", ""), BumpType.PATCH),
+            (("", ""), BumpType.NONE),
+        ],
+        ids=["major", "minor", "patch", "none"],
+    )
+    def test_bump_detection(
+        self,
+        mock_repo: GitRepository,
+        default_config: ReleasePyConfig,
+        mock_subprocess_run: MagicMock,
+        output: tuple[str, str],
+        expected: BumpType,
+    ):
+        """Detect the bump type from git-cliff (stdout, stderr) output."""
+        stdout, stderr = output
+        mock_subprocess_run.return_value = _Completed(
+            stdout=stdout,
+            stderr=stderr,
+        )
 
-    def test_bump_none_no_commits(self, mock_repo: MagicMock, tmp_path: Path):
-        """Return NONE when git-cliff reports no commits."""
-        config = ReleasePyConfig()
-        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
+        result = get_bump_from_git_cliff(mock_repo, default_config)
+        assert result == expected
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.CalledProcessError(
-                1, "git-cliff", stderr="no commits to process"
-            )
+    def test_bump_none_no_commits(
+        self,
+        mock_repo: GitRepository,
+        default_config: ReleasePyConfig,
+        mock_subprocess_run: MagicMock,
+    ):
+        """Return NONE when git-cliff reports no commits."""
+        mock_subprocess_run.side_effect = subprocess.CalledProcessError(
+            1, "git-cliff", stderr="no commits to process"
+        )
 
-            result = get_bump_from_git_cliff(mock_repo, config)
-            assert result == BumpType.NONE
+        result = get_bump_from_git_cliff(mock_repo, default_config)
+        assert result == BumpType.NONE
 
-    def test_bump_git_cliff_error(self, mock_repo: MagicMock, tmp_path: Path):
+    def test_bump_git_cliff_error(
+        self,
+        mock_repo: GitRepository,
+        default_config: ReleasePyConfig,
+        mock_subprocess_run: MagicMock,
+    ):
         """Raise GitCliffError on other git-cliff failures."""
-        config = ReleasePyConfig()
-        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.CalledProcessError(
-                1, "git-cliff", stderr="Invalid configuration"
-            )
+        mock_subprocess_run.side_effect = subprocess.CalledProcessError(
+            1, "git-cliff", stderr="Invalid configuration"
+        )
 
-            with pytest.raises(GitCliffError):
-                get_bump_from_git_cliff(mock_repo, config)
+        with pytest.raises(GitCliffError):
+            get_bump_from_git_cliff(mock_repo, default_config)
 
-    def test_bump_git_cliff_not_found(self, mock_repo: MagicMock):
+    def test_bump_git_cliff_not_found(
+        self,
+        mock_repo: GitRepository,
+        default_config: ReleasePyConfig,
+        mock_subprocess_run: MagicMock,
+    ):
         """Raise ChangelogError when git-cliff not found."""
-        config = ReleasePyConfig()
+        mock_subprocess_run.side_effect = FileNotFoundError("git-cliff not found")
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = FileNotFoundError("git-cliff not found")
-
-            with pytest.raises(ChangelogError, match="git-cliff not found"):
-                get_bump_from_git_cliff(mock_repo, config)
+        with pytest.raises(ChangelogError, match=_RE_NOT_FOUND):
+            get_bump_from_git_cliff(mock_repo, default_config)
 
 
 # =============================================================================
@@ -329,7 +506,7 @@ def sample_commit() -> Commit:
         message="feat: add new feature",
         author_name="Test Author",
         author_email="test@example.com",
-        date=datetime.now(),
+        date=_FIXED_NOW,
     )
 
 
@@ -349,17 +526,17 @@ def sample_parsed_commit(sample_commit: Commit) -> ParsedCommit:
 class TestIsGitCliffAvailable:
     """Tests for is_git_cliff_available()."""
 
-    def test_git_cliff_available(self):
+    def test_git_cliff_available(self, mocker: MockerFixture):
         """Return True when git-cliff is found."""
-        with patch("shutil.which") as mock_which:
-            mock_which.return_value = "/usr/bin/git-cliff"
-            assert is_git_cliff_available() is True
+        mock_which = mocker.patch("shutil.which")
+        mock_which.return_value = "/usr/bin/git-cliff"
+        assert is_git_cliff_available() is True
 
-    def test_git_cliff_not_available(self):
+    def test_git_cliff_not_available(self, mocker: MockerFixture):
         """Return False when git-cliff is not found."""
-        with patch("shutil.which") as mock_which:
-            mock_which.return_value = None
-            assert is_git_cliff_available() is False
+        mock_which = mocker.patch("shutil.which")
+        mock_which.return_value = None
+        assert is_git_cliff_available() is False
 
 
 class TestFormatCommitEntry:
@@ -448,19 +625,64 @@ class TestFormatCommitEntry:
         assert result == "add new feature"
 
 
+# One parsed commit per standard type, plus a breaking and a non-conventional one
+_ALL_TYPES_COMMITS = tuple(
+    ParsedCommit(
+        commit=Commit(
+            "abc1234", f"{commit_type}: change", "T", "t@t.com", datetime(2024, 1, 1, tzinfo=UTC)
+        ),
+        commit_type=commit_type,
+        scope=None,
+        description=f"{commit_type or 'other'} change",
+        is_breaking=commit_type == "refactor",
+        is_conventional=commit_type is not None,
+    )
+    for commit_type in (
+        "feat",
+        "fix",
+        "perf",
+        "docs",
+        "refactor",
+        "test",
+        "build",
+        "ci",
+        "style",
+        "chore",
+        None,
+    )
+)
+
+
+@pytest.fixture(scope="class")
+def all_types_changelog(version: Version) -> str:
+    """Changelog covering every standard section, generated once per class."""
+    # Pin the clock here too: frozen_now is not active for class-scoped fixtures
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("releasio.core.changelog.datetime", _FrozenDatetime)
+        return generate_native_changelog(list(_ALL_TYPES_COMMITS), version, ChangelogConfig())
+
+
 class TestGenerateNativeChangelog:
     """Tests for generate_native_changelog()."""
 
-    def test_generate_empty_commits(self):
+    @pytest.mark.parametrize("header", ChangelogConfig().section_headers.values())
+    def test_generate_all_types_has_section(self, all_types_changelog: str, header: str):
+        """Every default section header appears when its type is present."""
+        assert f"### {header}\n" in all_types_changelog
+
+    def test_generate_all_types_header_date(self, all_types_changelog: str):
+        """The version header carries the pinned release date."""
+        assert all_types_changelog.startswith("## [1.0.0] - 2024-06-15\n")
+
+    def test_generate_empty_commits(self, version: Version):
         """Return empty string for no commits."""
         config = ChangelogConfig()
-        version = Version(1, 0, 0)
 
         result = generate_native_changelog([], version, config)
 
         assert result == ""
 
-    def test_generate_single_commit(self, sample_commit: Commit):
+    def test_generate_single_commit(self, sample_commit: Commit, version: Version):
         """Generate changelog for single commit."""
         pc = ParsedCommit(
             commit=sample_commit,
@@ -471,7 +693,6 @@ class TestGenerateNativeChangelog:
             is_conventional=True,
         )
         config = ChangelogConfig()
-        version = Version(1, 0, 0)
 
         result = generate_native_changelog([pc], version, config)
 
@@ -479,7 +700,7 @@ class TestGenerateNativeChangelog:
         assert "### ✨ Features" in result
         assert "- add new feature" in result
 
-    def test_generate_multiple_types(self, sample_commit: Commit):
+    def test_generate_multiple_types(self, sample_commit: Commit, version: Version):
         """Generate changelog with multiple commit types."""
         commits = [
             ParsedCommit(
@@ -500,7 +721,6 @@ class TestGenerateNativeChangelog:
             ),
         ]
         config = ChangelogConfig()
-        version = Version(1, 0, 0)
 
         result = generate_native_changelog(commits, version, config)
 
@@ -539,7 +759,7 @@ class TestGenerateNativeChangelog:
         features_pos = result.find("✨ Features")
         assert breaking_pos < features_pos
 
-    def test_generate_with_custom_headers(self, sample_commit: Commit):
+    def test_generate_with_custom_headers(self, sample_commit: Commit, version: Version):
         """Use custom section headers."""
         pc = ParsedCommit(
             commit=sample_commit,
@@ -550,13 +770,12 @@ class TestGenerateNativeChangelog:
             is_conventional=True,
         )
         config = ChangelogConfig(section_headers={"feat": "🚀 New Features"})
-        version = Version(1, 0, 0)
 
         result = generate_native_changelog([pc], version, config)
 
         assert "### 🚀 New Features" in result
 
-    def test_generate_with_custom_changelog_group(self, sample_commit: Commit):
+    def test_generate_with_custom_changelog_group(self, sample_commit: Commit, version: Version):
         """Use custom changelog group from parser."""
         pc = ParsedCommit(
             commit=sample_commit,
@@ -568,7 +787,6 @@ class TestGenerateNativeChangelog:
             changelog_group="✨ Custom Features",
         )
         config = ChangelogConfig()
-        version = Version(1, 0, 0)
 
         result = generate_native_changelog([pc], version, config)
 
@@ -590,9 +808,9 @@ class TestGenerateNativeChangelog:
 
         result = generate_native_changelog([pc], version, config)
 
-        assert "## [2.1.3]" in result
+        assert "## [2.1.3] - 2024-06-15" in result
 
-    def test_generate_with_custom_header(self, sample_commit: Commit):
+    def test_generate_with_custom_header(self, sample_commit: Commit, version: Version):
         """Custom header appears at the top of changelog."""
         pc = ParsedCommit(
             commit=sample_commit,
@@ -604,7 +822,6 @@ class TestGenerateNativeChangelog:
         )
         custom_header = "# My Project Changelog\n\nAll notable changes are documented here."
         config = ChangelogConfig(header=custom_header)
-        version = Version(1, 0, 0)
 
         result = generate_native_changelog([pc], version, config)
 
@@ -616,7 +833,7 @@ class TestGenerateNativeChangelog:
         version_pos = result.find("## [1.0.0]")
         assert header_pos < version_pos
 
-    def test_generate_with_first_time_contributors(self, sample_commit: Commit):
+    def test_generate_with_first_time_contributors(self, sample_commit: Commit, version: Version):
         """First-time contributor badge is added to commit entries."""
         pc = ParsedCommit(
             commit=sample_commit,
@@ -627,7 +844,6 @@ class TestGenerateNativeChangelog:
             is_conventional=True,
         )
         config = ChangelogConfig(show_first_time_contributors=True)
-        version = Version(1, 0, 0)
 
         # sample_commit author is "Test Author"
         first_timers = {sample_commit.author_name}
@@ -639,7 +855,9 @@ class TestGenerateNativeChangelog:
         assert "🎉 First contribution!" in result
         assert "- new feature 🎉 First contribution!" in result
 
-    def test_generate_without_first_time_contributors_flag(self, sample_commit: Commit):
+    def test_generate_without_first_time_contributors_flag(
+        self, sample_commit: Commit, version: Version
+    ):
         """First-time contributor badge not shown when flag is disabled."""
         pc = ParsedCommit(
             commit=sample_commit,
@@ -650,7 +868,6 @@ class TestGenerateNativeChangelog:
             is_conventional=True,
         )
         config = ChangelogConfig(show_first_time_contributors=False)
-        version = Version(1, 0, 0)
 
         first_timers = {sample_commit.author_name}
 
@@ -660,7 +877,9 @@ class TestGenerateNativeChangelog:
 
         assert "🎉 First contribution!" not in result
 
-    def test_generate_with_custom_first_contributor_badge(self, sample_commit: Commit):
+    def test_generate_with_custom_first_contributor_badge(
+        self, sample_commit: Commit, version: Version
+    ):
         """Custom first contributor badge is used."""
         pc = ParsedCommit(
             commit=sample_commit,
@@ -674,7 +893,6 @@ class TestGenerateNativeChangelog:
             show_first_time_contributors=True,
             first_contributor_badge="(new contributor!)",
         )
-        version = Version(1, 0, 0)
 
         first_timers = {sample_commit.author_name}
 
@@ -685,7 +903,7 @@ class TestGenerateNativeChangelog:
         assert "(new contributor!)" in result
         assert "🎉 First contribution!" not in result
 
-    def test_generate_with_dependency_updates(self, sample_commit: Commit):
+    def test_generate_with_dependency_updates(self, sample_commit: Commit, version: Version):
         """Dependency updates section is included."""
         pc = ParsedCommit(
             commit=sample_commit,
@@ -696,7 +914,6 @@ class TestGenerateNativeChangelog:
             is_conventional=True,
         )
         config = ChangelogConfig(include_dependency_updates=True)
-        version = Version(1, 0, 0)
 
         dep_updates = [
             "httpx: 0.27.0 → 0.28.0",
@@ -711,7 +928,7 @@ class TestGenerateNativeChangelog:
         assert "- Added new-package 1.0.0" in result
         assert "- Removed old-package 0.5.0" in result
 
-    def test_generate_dependency_updates_disabled(self, sample_commit: Commit):
+    def test_generate_dependency_updates_disabled(self, sample_commit: Commit, version: Version):
         """Dependency updates section not shown when flag is disabled."""
         pc = ParsedCommit(
             commit=sample_commit,
@@ -722,7 +939,6 @@ class TestGenerateNativeChangelog:
             is_conventional=True,
         )
         config = ChangelogConfig(include_dependency_updates=False)
-        version = Version(1, 0, 0)
 
         dep_updates = ["httpx: 0.27.0 → 0.28.0"]
 
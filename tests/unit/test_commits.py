@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import UTC, datetime
+
+import pytest
 
 from releasio.config.models import CommitParser, CommitsConfig
 from releasio.core.commits import (
     DEFAULT_ALLOWED_TYPES,
     ParsedCommit,
+    _compile_breaking_pattern,
     calculate_bump,
     filter_skip_release_commits,
     format_commit_for_changelog,
     get_breaking_changes,
     group_commits_by_type,
+    make_commit_formatter,
     parse_commits,
     validate_pr_title,
     validate_pr_titles_batch,
@@ -20,6 +24,9 @@ from releasio.core.commits import (
 from releasio.core.version import BumpType
 from releasio.vcs.git import Commit
 
+# Commit timestamp for tests that don't care about dates
+_NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
 
 class TestParsedCommit:
     """Tests for ParsedCommit.from_commit()."""
@@ -31,7 +38,7 @@ class TestParsedCommit:
             message="feat: add new feature",
             author_name="Test",
             author_email="test@test.com",
-            date=datetime.now(),
+            date=_NOW,
         )
         pc = ParsedCommit.from_commit(commit, r"BREAKING[ -]CHANGE:")
 
@@ -48,7 +55,7 @@ class TestParsedCommit:
             message="fix(api): handle null response",
             author_name="Test",
             author_email="test@test.com",
-            date=datetime.now(),
+            date=_NOW,
         )
         pc = ParsedCommit.from_commit(commit, r"BREAKING[ -]CHANGE:")
 
@@ -63,7 +70,7 @@ class TestParsedCommit:
             message="feat!: redesign API",
             author_name="Test",
             author_email="test@test.com",
-            date=datetime.now(),
+            date=_NOW,
         )
         pc = ParsedCommit.from_commit(commit, r"BREAKING[ -]CHANGE:")
 
@@ -77,7 +84,7 @@ class TestParsedCommit:
             message="feat(core)!: change config format",
             author_name="Test",
             author_email="test@test.com",
-            date=datetime.now(),
+            date=_NOW,
         )
         pc = ParsedCommit.from_commit(commit, r"BREAKING[ -]CHANGE:")
 
@@ -92,12 +99,25 @@ class TestParsedCommit:
             message="feat: new feature\n\nBREAKING CHANGE: old API removed",
             author_name="Test",
             author_email="test@test.com",
-            date=datetime.now(),
+            date=_NOW,
         )
         pc = ParsedCommit.from_commit(commit, r"BREAKING[ -]CHANGE:")
 
         assert pc.is_breaking
 
+    def test_breaking_pattern_compiled_once(self):
+        """The breaking-change pattern is compiled once and reused across commits."""
+        commits = [
+            Commit("a", "feat: one\n\nbreaking change: gone", "T", "t@t.com", _NOW),
+            Commit("b", "fix: two\n\nJust a body", "T", "t@t.com", _NOW),
+        ]
+        _compile_breaking_pattern.cache_clear()
+
+        parsed = [ParsedCommit.from_commit(c, r"BREAKING[ -]CHANGE:") for c in commits]
+
+        assert [pc.is_breaking for pc in parsed] == [True, False]
+        assert _compile_breaking_pattern.cache_info().misses == 1
+
     def test_parse_non_conventional(self):
         """Parse non-conventional commit."""
         commit = Commit(
@@ -105,7 +125,7 @@ class TestParsedCommit:
             message="Updated the readme file",
             author_name="Test",
             author_email="test@test.com",
-            date=datetime.now(),
+            date=_NOW,
         )
         pc = ParsedCommit.from_commit(commit, r"BREAKING[ -]CHANGE:")
 
@@ -128,9 +148,9 @@ class TestParseCommits:
     def test_filter_by_scope(self):
         """Filter commits by scope regex."""
         commits = [
-            Commit("a", "feat(api): feature 1", "T", "t@t.com", datetime.now()),
-            Commit("b", "fix(core): fix 1", "T", "t@t.com", datetime.now()),
-            Commit("c", "feat(api): feature 2", "T", "t@t.com", datetime.now()),
+            Commit("a", "feat(api): feature 1", "T", "t@t.com", _NOW),
+            Commit("b", "fix(core): fix 1", "T", "t@t.com", _NOW),
+            Commit("c", "feat(api): feature 2", "T", "t@t.com", _NOW),
         ]
         config = CommitsConfig(scope_regex=r"^api$")
         parsed = parse_commits(commits, config)
@@ -138,6 +158,28 @@ class TestParseCommits:
         assert len(parsed) == 2
         assert all(pc.scope == "api" for pc in parsed)
 
+    def test_scope_filter_keeps_unscoped_commits(self):
+        """Commits without a scope are not dropped by the scope filter."""
+        commits = [
+            Commit("a", "feat: global feature", "T", "t@t.com", _NOW),
+            Commit("b", "fix(core): fix 1", "T", "t@t.com", _NOW),
+        ]
+        config = CommitsConfig(scope_regex=r"^api$")
+        parsed = parse_commits(commits, config)
+
+        assert [pc.description for pc in parsed] == ["global feature"]
+
+    def test_types_and_scopes_are_shared(self):
+        """Repeated types and scopes resolve to one shared string object."""
+        commits = [
+            Commit("a", "Feat(api): feature 1", "T", "t@t.com", _NOW),
+            Commit("b", "feat(api): feature 2", "T", "t@t.com", _NOW),
+        ]
+        first, second = parse_commits(commits, CommitsConfig())
+
+        assert first.commit_type is second.commit_type
+        assert first.scope is second.scope
+
 
 class TestCalculateBump:
     """Tests for calculate_bump()."""
@@ -186,7 +228,7 @@ class TestCalculateBump:
     def test_custom_types_major(self):
         """Custom commit types can trigger MAJOR bump."""
         config = CommitsConfig(types_major=["remove"])
-        commit = Commit("a", "remove: delete deprecated API", "T", "t@t.com", datetime.now())
+        commit = Commit("a", "remove: delete deprecated API", "T", "t@t.com", _NOW)
         parsed = [ParsedCommit.from_commit(commit, config.breaking_pattern)]
         assert calculate_bump(parsed, config) == BumpType.MAJOR
 
@@ -254,6 +296,26 @@ class TestFormatCommitForChangelog:
 
         assert "feat123" in formatted
 
+    @pytest.mark.parametrize("include_sha", [False, True])
+    @pytest.mark.parametrize("include_scope", [False, True])
+    def test_make_commit_formatter_matches_single_call(
+        self,
+        include_sha: bool,
+        include_scope: bool,
+        feat_commit: Commit,
+        fix_commit: Commit,
+        breaking_commit: Commit,
+    ):
+        """Prebuilt formatters match format_commit_for_changelog() for every option."""
+        config = CommitsConfig()
+        formatter = make_commit_formatter(include_sha=include_sha, include_scope=include_scope)
+
+        for commit in (feat_commit, fix_commit, breaking_commit):
+            pc = ParsedCommit.from_commit(commit, config.breaking_pattern)
+            assert formatter(pc) == format_commit_for_changelog(
+                pc, include_sha=include_sha, include_scope=include_scope
+            )
+
 
 # =============================================================================
 # Skip Release Marker Tests
@@ -266,9 +328,9 @@ class TestFilterSkipReleaseCommits:
     def test_filter_with_skip_release_marker(self):
         """Commits with [skip release] are filtered out."""
         commits = [
-            Commit("a", "feat: add feature", "T", "t@t.com", datetime.now()),
-            Commit("b", "fix: bug fix [skip release]", "T", "t@t.com", datetime.now()),
-            Commit("c", "docs: update readme", "T", "t@t.com", datetime.now()),
+            Commit("a", "feat: add feature", "T", "t@t.com", _NOW),
+            Commit("b", "fix: bug fix [skip release]", "T", "t@t.com", _NOW),
+            Commit("c", "docs: update readme", "T", "t@t.com", _NOW),
         ]
         filtered = filter_skip_release_commits(commits, ["[skip release]"])
 
@@ -279,8 +341,8 @@ class TestFilterSkipReleaseCommits:
     def test_filter_with_release_skip_marker(self):
         """Commits with [release skip] are filtered out."""
         commits = [
-            Commit("a", "feat: add feature [release skip]", "T", "t@t.com", datetime.now()),
-            Commit("b", "fix: bug fix", "T", "t@t.com", datetime.now()),
+            Commit("a", "feat: add feature [release skip]", "T", "t@t.com", _NOW),
+            Commit("b", "fix: bug fix", "T", "t@t.com", _NOW),
         ]
         filtered = filter_skip_release_commits(commits, ["[release skip]"])
 
@@ -290,9 +352,9 @@ class TestFilterSkipReleaseCommits:
     def test_filter_case_insensitive(self):
         """Skip markers are matched case-insensitively."""
         commits = [
-            Commit("a", "feat: add feature [SKIP RELEASE]", "T", "t@t.com", datetime.now()),
-            Commit("b", "fix: bug fix [Skip Release]", "T", "t@t.com", datetime.now()),
-            Commit("c", "docs: update readme", "T", "t@t.com", datetime.now()),
+            Commit("a", "feat: add feature [SKIP RELEASE]", "T", "t@t.com", _NOW),
+            Commit("b", "fix: bug fix [Skip Release]", "T", "t@t.com", _NOW),
+            Commit("c", "docs: update readme", "T", "t@t.com", _NOW),
         ]
         filtered = filter_skip_release_commits(commits, ["[skip release]"])
 
@@ -302,10 +364,10 @@ class TestFilterSkipReleaseCommits:
     def test_filter_multiple_patterns(self):
         """Multiple skip patterns are all respected."""
         commits = [
-            Commit("a", "feat: add feature [skip release]", "T", "t@t.com", datetime.now()),
-            Commit("b", "fix: bug fix [no release]", "T", "t@t.com", datetime.now()),
-            Commit("c", "docs: update readme [release skip]", "T", "t@t.com", datetime.now()),
-            Commit("d", "chore: cleanup", "T", "t@t.com", datetime.now()),
+            Commit("a", "feat: add feature [skip release]", "T", "t@t.com", _NOW),
+            Commit("b", "fix: bug fix [no release]", "T", "t@t.com", _NOW),
+            Commit("c", "docs: update readme [release skip]", "T", "t@t.com", _NOW),
+            Commit("d", "chore: cleanup", "T", "t@t.com", _NOW),
         ]
         patterns = ["[skip release]", "[no release]", "[release skip]"]
         filtered = filter_skip_release_commits(commits, patterns)
@@ -316,8 +378,8 @@ class TestFilterSkipReleaseCommits:
     def test_filter_empty_patterns_returns_all(self):
         """Empty patterns list returns all commits."""
         commits = [
-            Commit("a", "feat: add feature [skip release]", "T", "t@t.com", datetime.now()),
-            Commit("b", "fix: bug fix", "T", "t@t.com", datetime.now()),
+            Commit("a", "feat: add feature [skip release]", "T", "t@t.com", _NOW),
+            Commit("b", "fix: bug fix", "T", "t@t.com", _NOW),
         ]
         filtered = filter_skip_release_commits(commits, [])
 
@@ -331,9 +393,9 @@ class TestFilterSkipReleaseCommits:
                 "feat: add feature\n\nSome details [skip release]",
                 "T",
                 "t@t.com",
-                datetime.now(),
+                _NOW,
             ),
-            Commit("b", "fix: bug fix", "T", "t@t.com", datetime.now()),
+            Commit("b", "fix: bug fix", "T", "t@t.com", _NOW),
         ]
         filtered = filter_skip_release_commits(commits, ["[skip release]"])
 
@@ -343,13 +405,24 @@ class TestFilterSkipReleaseCommits:
     def test_filter_all_commits_skipped(self):
         """All commits with skip markers returns empty list."""
         commits = [
-            Commit("a", "feat: add feature [skip release]", "T", "t@t.com", datetime.now()),
-            Commit("b", "fix: bug fix [skip release]", "T", "t@t.com", datetime.now()),
+            Commit("a", "feat: add feature [skip release]", "T", "t@t.com", _NOW),
+            Commit("b", "fix: bug fix [skip release]", "T", "t@t.com", _NOW),
         ]
         filtered = filter_skip_release_commits(commits, ["[skip release]"])
 
         assert len(filtered) == 0
 
+    def test_filter_patterns_are_literal(self):
+        """Regex metacharacters in skip markers are matched literally."""
+        commits = [
+            Commit("a", "feat: add feature (skip.*)", "T", "t@t.com", _NOW),
+            Commit("b", "fix: skip this bug", "T", "t@t.com", _NOW),
+        ]
+        filtered = filter_skip_release_commits(commits, ["(skip.*)"])
+
+        assert len(filtered) == 1
+        assert filtered[0].sha == "b"
+
 
 # =============================================================================
 # PR Title Validation Tests
@@ -460,6 +533,12 @@ class TestValidatePrTitle:
         assert result.error is not None
         assert "Invalid commit type" in result.error
 
+    def test_plain_set_allowed_types_rejects_unknown(self):
+        """A plain set of allowed types still yields an error result, not a crash."""
+        result = validate_pr_title("foo: x", {"feat", "fix"})  # type: ignore[arg-type]
+        assert not result.is_valid
+        assert result.error == "Invalid commit type 'foo'. Allowed: feat, fix"
+
     def test_all_default_types_valid(self):
         """All default commit types are valid."""
         for commit_type in DEFAULT_ALLOWED_TYPES:
@@ -472,6 +551,14 @@ class TestValidatePrTitle:
         assert result.is_valid
         assert result.commit_type == "feat"  # Normalized to lowercase
 
+    def test_mixed_case_type_keeps_scope_case(self):
+        """Only the type is normalized; scope and breaking marker are preserved."""
+        result = validate_pr_title("Fix(API)!: handle errors")
+        assert result.is_valid
+        assert result.commit_type == "fix"
+        assert result.scope == "API"
+        assert result.is_breaking
+
 
 class TestValidatePrTitlesBatch:
     """Tests for validate_pr_titles_batch()."""
@@ -501,6 +588,28 @@ class TestValidatePrTitlesBatch:
         assert not results[0].is_valid  # No scope
         assert results[1].is_valid  # Has scope
 
+    def test_batch_matches_single_validation(self):
+        """Batch results are identical to validating each title on its own."""
+        titles = [
+            "feat: add feature",
+            "  fix(api)!: trimmed breaking fix  ",
+            "unknown: type",
+            "feat:    ",
+            "",
+            "feat(api): " + "x" * 100,
+            "docs: line one\nfeat: line two",
+        ]
+
+        results = validate_pr_titles_batch(titles)
+
+        assert results == [validate_pr_title(title) for title in titles]
+
+    def test_results_have_no_instance_dict(self):
+        """Results are slotted, so large batches carry no per-instance __dict__."""
+        results = validate_pr_titles_batch(["feat: add feature", "invalid title"])
+
+        assert all(not hasattr(result, "__dict__") for result in results)
+
 
 # =============================================================================
 # Custom Parser Tests
@@ -522,7 +631,7 @@ class TestCustomParsers:
             message=":sparkles: add new feature",
             author_name="Test",
             author_email="test@test.com",
-            date=datetime.now(),
+            date=_NOW,
         )
         pc = ParsedCommit.from_commit(
             commit,
@@ -548,7 +657,7 @@ class TestCustomParsers:
             message=":bug: fix authentication issue",
             author_name="Test",
             author_email="test@test.com",
-            date=datetime.now(),
+            date=_NOW,
         )
         pc = ParsedCommit.from_commit(
             commit,
@@ -573,7 +682,7 @@ class TestCustomParsers:
             message=":boom: redesign API",
             author_name="Test",
             author_email="test@test.com",
-            date=datetime.now(),
+            date=_NOW,
         )
         pc = ParsedCommit.from_commit(
             commit,
@@ -598,7 +707,7 @@ class TestCustomParsers:
             message="[api] update authentication",
             author_name="Test",
             author_email="test@test.com",
-            date=datetime.now(),
+            date=_NOW,
         )
         pc = ParsedCommit.from_commit(
             commit,
@@ -629,7 +738,7 @@ class TestCustomParsers:
             message=":sparkles: add feature",
             author_name="Test",
             author_email="test@test.com",
-            date=datetime.now(),
+            date=_NOW,
         )
         pc = ParsedCommit.from_commit(
             commit,
@@ -653,7 +762,7 @@ class TestCustomParsers:
             message="fix(api): handle error",  # Conventional format
             author_name="Test",
             author_email="test@test.com",
-            date=datetime.now(),
+            date=_NOW,
         )
         pc = ParsedCommit.from_commit(
             commit,
@@ -679,7 +788,7 @@ class TestCustomParsers:
             message="fix(api): handle error",  # Conventional format
             author_name="Test",
             author_email="test@test.com",
-            date=datetime.now(),
+            date=_NOW,
         )
         pc = ParsedCommit.from_commit(
             commit,
@@ -714,21 +823,21 @@ class TestCustomParsers:
                 message=":sparkles: add feature",
                 author_name="Test",
                 author_email="test@test.com",
-                date=datetime.now(),
+                date=_NOW,
             ),
             Commit(
                 sha="def456",
                 message=":bug: fix bug",
                 author_name="Test",
                 author_email="test@test.com",
-                date=datetime.now(),
+                date=_NOW,
             ),
             Commit(
                 sha="ghi789",
                 message="fix: conventional fix",  # Should fall back
                 author_name="Test",
                 author_email="test@test.com",
-                date=datetime.now(),
+                date=_NOW,
             ),
         ]
         parsed = parse_commits(commits, config)
@@ -753,7 +862,7 @@ class TestCustomParsers:
             message="feat: add feature",
             author_name="Test",
             author_email="test@test.com",
-            date=datetime.now(),
+            date=_NOW,
         )
         # Should not crash, just skip the invalid parser and fall back
         pc = ParsedCommit.from_commit(
@@ -778,7 +887,7 @@ class TestCustomParsers:
             message=":sparkles: add feature\n\nBREAKING CHANGE: API changed",
             author_name="Test",
             author_email="test@test.com",
-            date=datetime.now(),
+            date=_NOW,
         )
         pc = ParsedCommit.from_commit(
             commit,
@@ -807,7 +916,7 @@ class TestCustomParsers:
             message=":sparkles: add new feature",
             author_name="Test",
             author_email="test@test.com",
-            date=datetime.now(),
+            date=_NOW,
         )
         # Should not raise, invalid parser is skipped and valid one matches
         pc = ParsedCommit.from_commit(
@@ -832,7 +941,7 @@ class TestCustomParsers:
             message="feat: add new feature",
             author_name="Test",
             author_email="test@test.com",
-            date=datetime.now(),
+            date=_NOW,
         )
         # Invalid parser is skipped, falls back to conventional commit parsing
         pc = ParsedCommit.from_commit(
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from releasio.config.loader import (
+    clear_config_cache,
     extract_release_py_config,
     find_pyproject_toml,
     get_project_name,
@@ -28,6 +31,7 @@ from releasio.config.models import (
     VersionConfig,
 )
 from releasio.exceptions import ConfigNotFoundError, ConfigValidationError
+from releasio.project.pyproject import update_pyproject_version
 
 
 class TestReleasePyConfig:
@@ -51,6 +55,15 @@ class TestReleasePyConfig:
         assert config.github.release_pr_branch == "releasio/release"
         assert config.publish.tool == "uv"
 
+    def test_config_is_frozen(self):
+        """Configs are immutable, so cached instances can be shared safely."""
+        config = ReleasePyConfig()
+
+        with pytest.raises(ValidationError, match="frozen"):
+            config.default_branch = "develop"
+        with pytest.raises(ValidationError, match="frozen"):
+            config.hooks.parallel = True
+
     def test_is_monorepo(self):
         """is_monorepo detects monorepo configuration."""
         config = ReleasePyConfig()
@@ -427,6 +440,7 @@ class TestHooksConfig:
         assert config.pre_release == []
         assert config.post_release == []
         assert config.build is None
+        assert config.parallel is False
 
     def test_custom_hooks(self):
         """Custom hooks can be configured."""
@@ -612,6 +626,45 @@ name = "test"
         with pytest.raises(ConfigValidationError, match="Invalid TOML"):
             load_pyproject_toml(pyproject)
 
+    def test_repeated_load_is_cached(self, temp_git_repo_with_pyproject: Path):
+        """Loading the same unchanged file twice reuses the parsed data."""
+        pyproject_path = temp_git_repo_with_pyproject / "pyproject.toml"
+
+        assert load_pyproject_toml(pyproject_path) is load_pyproject_toml(pyproject_path)
+
+    def test_version_update_is_reloaded(self, tmp_path: Path):
+        """A same-size version bump written in place of the file is picked up."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "test"\nversion = "1.0.0"\n')
+        assert get_project_version(tmp_path) == "1.0.0"
+
+        update_pyproject_version(tmp_path, "1.1.0")
+
+        assert get_project_version(tmp_path) == "1.1.0"
+
+    def test_in_place_version_update_is_reloaded(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """A hard-linked file bumped in place within one mtime tick is picked up."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "test"\nversion = "1.2.3"\n')
+        (tmp_path / "pyproject.link").hardlink_to(pyproject)
+        assert get_project_version(tmp_path) == "1.2.3"
+
+        # Emulate a coarse filesystem clock: the write keeps the old mtime
+        write_bytes = Path.write_bytes
+
+        def coarse_write_bytes(self: Path, data: bytes) -> int:
+            mtime_ns = self.stat().st_mtime_ns
+            written = write_bytes(self, data)
+            os.utime(self, ns=(mtime_ns, mtime_ns))
+            return written
+
+        monkeypatch.setattr(Path, "write_bytes", coarse_write_bytes)
+        update_pyproject_version(tmp_path, "1.2.4")
+
+        assert get_project_version(tmp_path) == "1.2.4"
+
 
 class TestFindPyprojectToml:
     """Tests for find_pyproject_toml()."""
@@ -634,6 +687,24 @@ class TestFindPyprojectToml:
         with pytest.raises(ConfigNotFoundError):
             find_pyproject_toml(tmp_path)
 
+    def test_unreadable_dir_is_skipped(
+        self, temp_git_repo_with_pyproject: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """A directory that cannot be inspected does not stop the walk."""
+        subdir = (temp_git_repo_with_pyproject / "locked").resolve()
+        subdir.mkdir()
+        is_file = Path.is_file
+
+        def guarded_is_file(self: Path) -> bool:
+            if self.parent == subdir:
+                raise PermissionError(self)
+            return is_file(self)
+
+        monkeypatch.setattr(Path, "is_file", guarded_is_file)
+
+        found = find_pyproject_toml(subdir)
+        assert found == temp_git_repo_with_pyproject.resolve() / "pyproject.toml"
+
 
 class TestExtractReleasePyConfig:
     """Tests for extract_release_py_config()."""
@@ -683,6 +754,50 @@ version = "1.0.0"
         config = load_config(tmp_path)
         assert config.default_branch == "main"
 
+    def test_repeated_load_is_cached(self, temp_git_repo_with_pyproject: Path):
+        """Loading the same unchanged config twice reuses the parsed result."""
+        first = load_config(temp_git_repo_with_pyproject)
+        second = load_config(temp_git_repo_with_pyproject / "pyproject.toml")
+
+        assert first is second
+
+    def test_modified_config_is_reloaded(self, tmp_path: Path):
+        """Editing the config file invalidates the cached result."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "test"\nversion = "1.0.0"\n')
+        assert load_config(tmp_path).default_branch == "main"
+
+        pyproject.write_text(
+            '[project]\nname = "test"\nversion = "1.0.0"\n\n'
+            '[tool.releasio]\ndefault_branch = "develop"\n'
+        )
+        assert load_config(tmp_path).default_branch == "develop"
+
+    def test_replaced_config_is_reloaded(self, tmp_path: Path):
+        """A same-size file swapped in within one mtime tick is picked up."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text(
+            '[project]\nname = "test"\n\n[tool.releasio]\ndefault_branch = "main"\n'
+        )
+        assert load_config(tmp_path).default_branch == "main"
+
+        replacement = tmp_path / "pyproject.toml.new"
+        replacement.write_text(
+            '[project]\nname = "test"\n\n[tool.releasio]\ndefault_branch = "next"\n'
+        )
+        mtime_ns = pyproject.stat().st_mtime_ns
+        os.utime(replacement, ns=(mtime_ns, mtime_ns))
+        replacement.replace(pyproject)
+
+        assert load_config(tmp_path).default_branch == "next"
+
+    def test_clear_config_cache(self, temp_git_repo_with_pyproject: Path):
+        """clear_config_cache() forces the next load to re-parse."""
+        first = load_config(temp_git_repo_with_pyproject)
+        clear_config_cache()
+
+        assert load_config(temp_git_repo_with_pyproject) is not first
+
 
 class TestGetProjectInfo:
     """Tests for get_project_name() and get_project_version()."""
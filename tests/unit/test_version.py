@@ -73,6 +73,16 @@ class TestVersionParsing:
         with pytest.raises(InvalidVersionError):
             Version.parse("-1.0.0")
 
+    def test_parse_is_memoized(self):
+        """Parsing the same string twice returns the cached instance."""
+        assert Version.parse("3.1.4") is Version.parse("3.1.4")
+
+    def test_parse_invalid_version_raises_every_time(self):
+        """Failed parses are not cached."""
+        for _ in range(2):
+            with pytest.raises(InvalidVersionError):
+                Version.parse("not-a-version")
+
 
 class TestVersionStr:
     """Tests for Version.__str__()."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING
 
 import pytest
@@ -18,6 +19,8 @@ from releasio.project.pyproject import (
 if TYPE_CHECKING:
     from pathlib import Path
 
+_COMPILED_VERSION_PATTERNS = tuple(re.compile(pat) for pat in VERSION_PATTERNS)
+
 
 class TestDetectVersionFiles:
     """Tests for detect_version_files function."""
@@ -268,24 +271,18 @@ class TestVersionPatterns:
 
     def test_patterns_match_dunder_version(self):
         """Patterns match __version__ = '...'."""
-        import re
-
         text = '__version__ = "1.0.0"'
-        matched = any(re.search(pat, text) for pat in VERSION_PATTERNS)
+        matched = any(pat.search(text) for pat in _COMPILED_VERSION_PATTERNS)
         assert matched
 
     def test_patterns_match_uppercase_version(self):
         """Patterns match VERSION = '...'."""
-        import re
-
         text = 'VERSION = "1.0.0"'
-        matched = any(re.search(pat, text) for pat in VERSION_PATTERNS)
+        matched = any(pat.search(text) for pat in _COMPILED_VERSION_PATTERNS)
         assert matched
 
     def test_patterns_match_lowercase_version(self):
         """Patterns match version = '...'."""
-        import re
-
         text = 'version = "1.0.0"'
-        matched = any(re.search(pat, text) for pat in VERSION_PATTERNS)
+        matched = any(pat.search(text) for pat in _COMPILED_VERSION_PATTERNS)
         assert matched